@@ -42,16 +42,18 @@ class MongoDB:
         if not self._client_instance:
             self._client_instance = self._MongoClient(self._uri)
             LOGGER.debug(
-                "new MongoDB client created: <%s at %s>",
-                repr(self._client_instance),
+                "new MongoDB client created: <%r at %s>",
+                self._client_instance,
                 id(self._client_instance),
             )
 
-        LOGGER.debug(
-            "using MongoDB client: <%s at %s>",
-            repr(self._client_instance),
-            id(self._client_instance),
-        )
+        # este acesso ocorre diversas vezes em cada requisição.
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "using MongoDB client: <%r at %s>",
+                self._client_instance,
+                id(self._client_instance),
+            )
         return self._client_instance
 
     def _db(self):
@@ -113,7 +115,7 @@ class BaseStore(interfaces.DataStore):
 
     def _pre_write(self, data) -> dict:
         """Tratamento anterior ao armazenamento do dado no MongoDB."""
-        _manifest = data.manifest
+        _manifest = dict(data.manifest)
         if not _manifest.get("_id"):
             _manifest["_id"] = data.id()
         return _manifest["_id"], _manifest
@@ -1,24 +1,40 @@
-import itertools
-from copy import deepcopy
-from io import BytesIO
+import bisect
 import re
-from typing import Union, Callable, Any, Tuple, List
+import contextlib
+import functools
+import uuid
+from xml.sax.saxutils import escape
+from typing import Union, Callable, Any, Tuple, List, Iterable, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
-import requests
-from lxml import etree
-
 from . import exceptions
 
 __all__ = ["Document"]
 
-DEFAULT_XMLPARSER = etree.XMLParser(
-    remove_blank_text=False,
-    remove_comments=False,
-    load_dtd=False,
-    no_network=True,
-    collect_ids=False,
-)
+# `requests` e `lxml` são importados apenas quando necessários, o que reduz o
+# tempo de carga do módulo para os clientes que fornecem suas próprias funções
+# de obtenção dos dados, como `assets_getter`.
+
+
+def _new_xmlparser():
+    from lxml import etree
+
+    return etree.XMLParser(
+        remove_blank_text=False,
+        remove_comments=False,
+        load_dtd=False,
+        no_network=True,
+        collect_ids=False,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _default_xmlparser():
+    return _new_xmlparser()
+
+
+_YEAR_REGEX = re.compile(r"^\d{4}$")
 
 SUBJECT_AREAS = (
     "AGRICULTURAL SCIENCES",
@@ -31,13 +47,39 @@ SUBJECT_AREAS = (
     "LINGUISTIC, LITERATURE AND ARTS",
 )
 
+# conjunto usado apenas para a validação, que ocorre a cada atribuição de
+# `Journal.subject_areas`. `SUBJECT_AREAS` permanece uma tupla para preservar
+# a ordem em que as áreas são apresentadas.
+_SUBJECT_AREAS_SET = frozenset(SUBJECT_AREAS)
+
 
 def utcnow():
-    return str(datetime.utcnow().isoformat() + "Z")
+    return datetime.utcnow().isoformat() + "Z"
+
+
+def _clone(obj):
+    """Produz uma cópia profunda de `obj`, que deve conter apenas estruturas
+    compatíveis com JSON, i.e., dicionários, listas, tuplas e valores
+    imutáveis. É muito mais rápida que `copy.deepcopy` por não manter memo nem
+    consultar os protocolos de cópia dos objetos.
+    """
+    _type = type(obj)
+    if _type is dict:
+        return {key: _clone(value) for key, value in obj.items()}
+    elif _type is list:
+        return [_clone(value) for value in obj]
+    elif _type is tuple:
+        return tuple(_clone(value) for value in obj)
+    else:
+        return obj
 
 
 class DocumentManifest:
     """Namespace para funções que manipulam o manifesto do documento.
+
+    As funções nunca modificam o manifesto recebido: um novo manifesto é
+    produzido recriando apenas o caminho alterado, e as demais estruturas são
+    compartilhadas entre o manifesto original e o novo.
     """
 
     @staticmethod
@@ -57,7 +99,6 @@ class DocumentManifest:
         assets: Union[dict, list],
         now: Callable[[], str] = utcnow,
     ) -> dict:
-        _manifest = deepcopy(manifest)
         version = DocumentManifest._new_version(data_uri, assets, now=now)
         for asset_id in assets:
             try:
@@ -66,57 +107,145 @@ class DocumentManifest:
                 break
             else:
                 if asset_uri:
-                    version = DocumentManifest._new_asset_version(
-                        version, asset_id, asset_uri, now=now
-                    )
-        _manifest["versions"].append(version)
-        return _manifest
+                    # `version` acabou de ser criada e não é compartilhada,
+                    # então pode ser modificada diretamente.
+                    version["assets"][asset_id].append((now(), asset_uri))
+        return {**manifest, "versions": manifest["versions"] + [version]}
 
     def _new_asset_version(
         version: dict, asset_id: str, asset_uri: str, now: Callable[[], str] = utcnow
     ) -> dict:
-        _version = deepcopy(version)
-        _version["assets"][asset_id].append((now(), asset_uri))
-        return _version
+        _assets = version["assets"]
+        return {
+            **version,
+            "assets": {**_assets, asset_id: _assets[asset_id] + [(now(), asset_uri)]},
+        }
 
     @staticmethod
     def add_asset_version(
         manifest: dict, asset_id: str, asset_uri: str, now: Callable[[], str] = utcnow
     ) -> dict:
-        _manifest = deepcopy(manifest)
-        _manifest["versions"][-1] = DocumentManifest._new_asset_version(
-            _manifest["versions"][-1], asset_id, asset_uri, now=now
+        _versions = list(manifest["versions"])
+        _versions[-1] = DocumentManifest._new_asset_version(
+            _versions[-1], asset_id, asset_uri, now=now
         )
-        return _manifest
+        return {**manifest, "versions": _versions}
 
 
-def get_static_assets(xml_et):
-    """Retorna uma lista das URIs dos ativos digitais de ``xml_et``.
-    """
-    paths = [
-        "//graphic[@xlink:href]",
-        "//media[@xlink:href]",
-        "//inline-graphic[@xlink:href]",
-        "//supplementary-material[@xlink:href]",
-        "//inline-supplementary-material[@xlink:href]",
-    ]
+XLINK_NAMESPACE = "http://www.w3.org/1999/xlink"
 
-    iterators = [
-        xml_et.iterfind(path, namespaces={"xlink": "http://www.w3.org/1999/xlink"})
-        for path in paths
+XLINK_HREF = "{%s}href" % XLINK_NAMESPACE
+
+STATIC_ASSETS_TAGS = frozenset(
+    [
+        "graphic",
+        "media",
+        "inline-graphic",
+        "supplementary-material",
+        "inline-supplementary-material",
     ]
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _static_assets_xpath():
+    from lxml import etree
+
+    return etree.XPath(
+        "//*[%s][@xlink:href]"
+        % " or ".join("self::%s" % tag for tag in sorted(STATIC_ASSETS_TAGS)),
+        namespaces={"xlink": XLINK_NAMESPACE},
+    )
+
+
+_LAZY_ATTRIBUTES = {
+    "DEFAULT_XMLPARSER": _default_xmlparser,
+    "STATIC_ASSETS_XPATH": _static_assets_xpath,
+}
+
+
+def __getattr__(name):
+    try:
+        return _LAZY_ATTRIBUTES[name]()
+    except KeyError:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name)
+        ) from None
 
-    elements = itertools.chain(*iterators)
 
+def get_static_assets(xml_et):
+    """Retorna uma lista das URIs dos ativos digitais de ``xml_et``, na ordem
+    em que aparecem no documento.
+    """
     return [
-        (element.attrib["{http://www.w3.org/1999/xlink}href"], element)
-        for element in elements
+        (element.attrib[XLINK_HREF], element)
+        for element in _static_assets_xpath()(xml_et)
     ]
 
 
-def fetch_data(url: str, timeout: float = 2) -> bytes:
+class _StaticAssetsCollector:
+    """Alvo para `etree.XMLParser` que coleta as URIs dos ativos digitais à
+    medida que o XML é analisado, sem construir a árvore de elementos.
+    """
+
+    def __init__(self):
+        self.hrefs = []
+
+    def start(self, tag, attrib):
+        if tag in STATIC_ASSETS_TAGS:
+            href = attrib.get(XLINK_HREF)
+            if href is not None:
+                self.hrefs.append(href)
+
+    def close(self):
+        return self.hrefs
+
+
+def get_static_assets_hrefs(source) -> List[str]:
+    """Retorna uma lista das URIs dos ativos digitais do XML lido de `source`,
+    na mesma ordem produzida por `get_static_assets`. Deve ser preferida
+    quando os nós do XML não forem necessários.
+    """
+    from lxml import etree
+
+    parser = etree.XMLParser(
+        target=_StaticAssetsCollector(), load_dtd=False, no_network=True
+    )
+    return etree.parse(source, parser)
+
+
+def _new_http_session(pool_size: int = 32) -> "requests.Session":
+    """Produz uma sessão HTTP que mantém as conexões abertas para que sejam
+    reutilizadas nas requisições subsequentes ao mesmo host.
+
+    Os cookies são descartados, já que a sessão é compartilhada entre threads e
+    hosts distintos.
+    """
+    import http.cookiejar
+    import requests
+
+    session = requests.Session()
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@functools.lru_cache(maxsize=1)
+def _http_session() -> "requests.Session":
+    """Sessão HTTP compartilhada por todas as requisições do módulo.
+    """
+    return _new_http_session()
+
+
+def _get(url: str, timeout: float, **kwargs) -> "requests.Response":
+    import requests
+
     try:
-        response = requests.get(url, timeout=timeout)
+        response = _http_session().get(url, timeout=timeout, **kwargs)
     except (requests.ConnectionError, requests.Timeout) as exc:
         raise exceptions.RetryableError(exc) from exc
     except (requests.InvalidSchema, requests.MissingSchema, requests.InvalidURL) as exc:
@@ -125,6 +254,7 @@ def fetch_data(url: str, timeout: float = 2) -> bytes:
         try:
             response.raise_for_status()
         except requests.HTTPError as exc:
+            response.close()
             if 400 <= exc.response.status_code < 500:
                 raise exceptions.NonRetryableError(exc) from exc
             elif 500 <= exc.response.status_code < 600:
@@ -132,39 +262,154 @@ def fetch_data(url: str, timeout: float = 2) -> bytes:
             else:
                 raise
 
-    return response.content
+    return response
+
 
+def fetch_data(url: str, timeout: float = 2) -> bytes:
+    return _get(url, timeout).content
+
+
+def fetch_data_many(
+    urls: Iterable[str], timeout: float = 2, max_workers: int = 16
+) -> Dict[str, bytes]:
+    """Obtém concorrentemente o conteúdo de cada URL em `urls` e retorna um
+    mapa entre as URLs e seus respectivos conteúdos.
+
+    Qualquer exceção lançada por `fetch_data` é propagada, sendo que as
+    requisições ainda pendentes são concluídas antes disso.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch_data, url, timeout): url for url in urls}
+        return {futures[future]: future.result() for future in as_completed(futures)}
 
-def assets_from_remote_xml(
-    url: str, timeout: float = 2, parser=DEFAULT_XMLPARSER
-) -> list:
-    data = fetch_data(url, timeout)
-    xml = etree.parse(BytesIO(data), parser)
+
+@contextlib.contextmanager
+def fetch_stream(url: str, timeout: float = 2):
+    """Gerenciador de contexto que produz um objeto *file-like* para a leitura
+    incremental do conteúdo de `url`, de maneira que não seja necessário
+    mantê-lo por completo em memória.
+
+    Falhas na obtenção do recurso são representadas pelas exceções
+    ``RetryableError`` e ``NonRetryableError``, assim como em `fetch_data`.
+    """
+    import urllib3
+
+    response = _get(url, timeout, stream=True)
+    response.raw.decode_content = True
+    try:
+        yield response.raw
+    except urllib3.exceptions.HTTPError as exc:
+        raise exceptions.RetryableError(exc) from exc
+    finally:
+        response.close()
+
+
+def assets_from_remote_xml(url: str, timeout: float = 2, parser=None) -> list:
+    from lxml import etree
+
+    # a lxml mantém a trava do parser durante toda a análise, e o conteúdo é
+    # lido da rede à medida que é analisado. Um parser compartilhado faria
+    # com que um único servidor lento bloqueasse as demais threads.
+    parser = parser if parser is not None else _new_xmlparser()
+    with fetch_stream(url, timeout) as stream:
+        xml = etree.parse(stream, parser)
     return xml, get_static_assets(xml)
 
 
+@functools.lru_cache(maxsize=256)
+def _remote_xml_template(url: str, timeout: float = 2) -> Tuple[tuple, tuple]:
+    """Obtém o XML em `url` e o serializa com os valores dos atributos
+    ``xlink:href`` dos ativos digitais substituídos por um marcador. Retorna o
+    par ``(partes, hrefs)``, onde ``partes`` é a sequência de fragmentos do XML
+    serializado entre os marcadores e ``hrefs`` as URIs originais dos ativos,
+    na mesma ordem.
+
+    O resultado é mantido em cache, partindo-se do princípio de que o conteúdo
+    de `url` é imutável.
+    """
+    from lxml import etree
+
+    xml, data_assets = assets_from_remote_xml(url, timeout)
+    placeholder = "documentstore-asset-%s" % uuid.uuid4().hex
+    for _, node in data_assets:
+        node.attrib[XLINK_HREF] = placeholder
+    data = etree.tostring(xml, encoding="utf-8", pretty_print=False)
+    parts = tuple(data.split(placeholder.encode("utf-8")))
+    return parts, tuple(href for href, _ in data_assets)
+
+
+def _escape_attribute(value: str) -> bytes:
+    return escape(
+        value, {'"': "&quot;", "\n": "&#10;", "\r": "&#13;", "\t": "&#9;"}
+    ).encode("utf-8")
+
+
+def version_data_chunks(data_url: str, assets: dict, timeout: float = 2) -> List[bytes]:
+    """Retorna o XML em `data_url` como uma lista de fragmentos, com as
+    referências aos ativos digitais substituídas pelas URIs em `assets`. Os
+    ativos sem URI mantêm a referência original presente no XML.
+
+    O conteúdo de uma versão do documento é determinado unicamente por
+    `data_url` e `assets`.
+    """
+    parts, hrefs = _remote_xml_template(data_url, timeout=timeout)
+    chunks = [parts[0]]
+    for asset_key, part in zip(hrefs, parts[1:]):
+        chunks.append(_escape_attribute(assets.get(asset_key) or asset_key))
+        chunks.append(part)
+    return chunks
+
+
+def assets_hrefs_from_remote_xml(url: str, timeout: float = 2) -> tuple:
+    """Variante de `assets_from_remote_xml` que não constrói a árvore de
+    elementos. Retorna o par ``(None, [(href, None), ...])``.
+    """
+    with fetch_stream(url, timeout) as stream:
+        hrefs = get_static_assets_hrefs(stream)
+    return None, [(href, None) for href in hrefs]
+
+
 class Document:
+    __slots__ = ("_manifest", "_latest_assets_cache")
+
     _timestamp_pattern = (
         r"^[0-9]{4}-[0-9]{2}-[0-9]{2}(T[0-9]{2}:[0-9]{2}(:[0-9]{2})?Z)?$"
     )
+    _timestamp_regex = re.compile(_timestamp_pattern)
+    _date_regex = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
     def __init__(self, id=None, manifest=None):
         assert any([id, manifest])
         self.manifest = manifest or DocumentManifest.new(id)
 
+    def __deepcopy__(self, memo):
+        # o manifesto contém apenas tipos do JSON, então `_clone` produz a
+        # mesma cópia que o mecanismo genérico de `copy.deepcopy`.
+        new = object.__new__(type(self))
+        new.manifest = _clone(self._manifest)
+        memo[id(self)] = new
+        return new
+
     @property
     def manifest(self):
-        return deepcopy(self._manifest)
+        """Manifesto do documento.
+
+        O dicionário retornado é o mesmo mantido pela instância e deve ser
+        tratado como somente leitura. Alterações devem ser feitas por meio dos
+        métodos de `Document`, que produzem novos manifestos.
+        """
+        return self._manifest
 
     @manifest.setter
     def manifest(self, value):
         self._manifest = value
+        self._latest_assets_cache = {}
 
     def id(self):
         return self.manifest.get("id", "")
 
     def new_version(
-        self, data_url, assets_getter=assets_from_remote_xml, timeout=2
+        self, data_url, assets_getter=assets_hrefs_from_remote_xml, timeout=2
     ) -> None:
         """Adiciona `data_url` como uma nova versão do documento.
 
@@ -176,14 +421,11 @@ class Document:
         que associa as URIs dos ativos com os nós do XML onde se encontram.
         Essa função deve ainda lançar as ``RetryableError`` e
         ``NonRetryableError`` para representar problemas no acesso aos dados
-        do XML.
+        do XML. Como apenas as URIs dos ativos são utilizadas, ``xml`` e
+        ``xml_node`` podem ser ``None``.
         """
-        try:
-            latest_version = self.version()
-        except ValueError:
-            latest_version = {"data": ""}
-
-        if latest_version.get("data") == data_url:
+        versions = self._manifest["versions"]
+        if versions and versions[-1].get("data") == data_url:
             raise exceptions.VersionAlreadySet(
                 "could not add version: the version is equal to the latest one"
             )
@@ -198,20 +440,26 @@ class Document:
         referências já existentes na última versão.
         """
         try:
-            latest_version = self.version()
-        except ValueError:
-            latest_version = {"assets": {}}
+            latest_assets = self._latest_assets(-1)
+        except IndexError:
+            latest_assets = {}
 
-        return {
-            asset_key: latest_version["assets"].get(asset_key, "")
-            for asset_key in tolink
-        }
+        return {asset_key: latest_assets.get(asset_key, "") for asset_key in tolink}
 
-    def version(self, index=-1) -> dict:
+    def _latest_assets(self, index: int) -> dict:
+        """Retorna o mapa entre os ativos da versão `index` e suas URIs mais
+        recentes. O resultado é memorizado até que o manifesto seja substituído
+        e não deve ser exposto sem antes ser copiado.
+
+        Lança `IndexError` caso a versão não exista.
+        """
+        versions = self._manifest["versions"]
+        version = versions[index]
+        position = index % len(versions)
         try:
-            version = self.manifest["versions"][index]
-        except IndexError:
-            raise ValueError("missing version for index: %s" % index) from None
+            return self._latest_assets_cache[position]
+        except KeyError:
+            pass
 
         def _latest(uris):
             try:
@@ -220,8 +468,16 @@ class Document:
                 return ""
 
         assets = {a: _latest(u) for a, u in version["assets"].items()}
-        version["assets"] = assets
-        return version
+        self._latest_assets_cache[position] = assets
+        return assets
+
+    def version(self, index=-1) -> dict:
+        try:
+            version = self.manifest["versions"][index]
+        except IndexError:
+            raise ValueError("missing version for index: %s" % index) from None
+
+        return {**version, "assets": dict(self._latest_assets(index))}
 
     def version_at(self, timestamp: str) -> dict:
         """Obtém os metadados da versão no momento `timestamp`.
@@ -234,45 +490,41 @@ class Document:
         para o nível dos microsegundos por meio da concatenação da string
         `T23:59:59:999999Z` ao valor de `timestamp`.
         """
-        if not re.match(self._timestamp_pattern, timestamp):
+        if not self._timestamp_regex.match(timestamp):
             raise ValueError(
                 "invalid format for timestamp: %s: must match pattern: %s"
                 % (timestamp, self._timestamp_pattern)
             )
 
-        if re.match(r"^\d{4}-\d{2}-\d{2}$", timestamp):
+        if self._date_regex.match(timestamp):
             timestamp = f"{timestamp}T23:59:59.999999Z"
 
-        try:
-            target_version = max(
-                itertools.takewhile(
-                    lambda version: version.get("timestamp", "") <= timestamp,
-                    self.manifest["versions"],
-                ),
-                key=lambda version: version.get("timestamp", ""),
-            )
-        except ValueError:
-            raise ValueError("missing version for timestamp: %s" % timestamp) from None
+        # as versões, assim como as versões de cada ativo, são acrescentadas em
+        # ordem cronológica e seus timestamps ISO 8601 podem ser comparados
+        # lexicograficamente, o que permite a busca binária nas versões e
+        # interromper a busca no primeiro resultado nas versões dos ativos.
+        versions = self.manifest["versions"]
+        position = bisect.bisect_right(
+            [version.get("timestamp", "") for version in versions], timestamp
+        )
+        if position == 0:
+            raise ValueError("missing version for timestamp: %s" % timestamp)
+        target_version = versions[position - 1]
 
         def _at_time(uris):
-            try:
-                target = max(
-                    itertools.takewhile(lambda asset: asset[0] <= timestamp, uris),
-                    key=lambda asset: asset[0],
-                )
-            except ValueError:
-                return ""
-            return target[1]
+            for asset_timestamp, asset_uri in reversed(uris):
+                if asset_timestamp <= timestamp:
+                    return asset_uri
+            return ""
 
         target_assets = {a: _at_time(u) for a, u in target_version["assets"].items()}
-        target_version["assets"] = target_assets
-        return target_version
+        return {**target_version, "assets": target_assets}
 
     def data(
         self,
         version_index=-1,
         version_at=None,
-        assets_getter=assets_from_remote_xml,
+        assets_getter=None,
         timeout=2,
     ) -> bytes:
         """Retorna o conteúdo do XML, codificado em UTF-8, já com as
@@ -289,36 +541,69 @@ class Document:
         Note que o argumento `version_at` é muito mais poderoso, uma vez que,
         diferentemente do `version_index`, também recupera o estado desejado
         no nível dos ativos digitais do documento.
+
+        Os ativos sem URI na versão solicitada mantêm a referência original
+        presente no XML.
+
+        O argumento `assets_getter` é opcional e segue a mesma especificação
+        descrita em `new_version`. Caso seja omitido, o XML remoto é obtido,
+        analisado e serializado apenas uma vez, e as requisições subsequentes
+        para a mesma URL apenas substituem as referências aos ativos.
         """
+        if assets_getter is None:
+            return b"".join(
+                self.data_chunks(
+                    version_index=version_index, version_at=version_at, timeout=timeout
+                )
+            )
+
+        from lxml import etree
+
         version = (
             self.version_at(version_at) if version_at else self.version(version_index)
         )
+        version_assets = version["assets"]
         xml_tree, data_assets = assets_getter(version["data"], timeout=timeout)
 
-        version_assets = version["assets"]
         for asset_key, target_node in data_assets:
             version_href = version_assets.get(asset_key, "")
-            target_node.attrib["{http://www.w3.org/1999/xlink}href"] = version_href
+            if version_href and target_node.attrib.get(XLINK_HREF) != version_href:
+                target_node.attrib[XLINK_HREF] = version_href
 
         return etree.tostring(xml_tree, encoding="utf-8", pretty_print=False)
 
+    def data_chunks(self, version_index=-1, version_at=None, timeout=2) -> List[bytes]:
+        """Equivalente a `data`, porém retorna o XML como uma lista de
+        fragmentos cuja concatenação corresponde ao documento. Os fragmentos
+        entre as referências aos ativos são compartilhados com o cache do XML
+        remoto, de maneira que o documento não precisa ser copiado por completo
+        a cada requisição.
+
+        Erros na obtenção da versão ou do XML são lançados imediatamente, e
+        não durante a iteração.
+        """
+        version = (
+            self.version_at(version_at) if version_at else self.version(version_index)
+        )
+        return version_data_chunks(version["data"], version["assets"], timeout=timeout)
+
     def new_asset_version(self, asset_id, data_url) -> None:
         """Adiciona `data_url` como uma nova versão do ativo `asset_id` vinculado
         a versão mais recente do documento. É importante notar que nenhuma validação
         será executada em `data_url`.
         """
         try:
-            latest_version = self.version()
-        except ValueError:
-            latest_version = {"assets": {}}
+            latest_assets = self._latest_assets(-1)
+        except IndexError:
+            latest_assets = {}
 
-        if latest_version.get("assets", {}).get(asset_id) == data_url:
+        if latest_assets.get(asset_id) == data_url:
             raise exceptions.VersionAlreadySet(
                 "could not add version: the version is equal to the latest one"
             )
 
         try:
-            self.manifest = DocumentManifest.add_asset_version(
+            manifest = DocumentManifest.add_asset_version(
                 self._manifest, asset_id, data_url
             )
         except KeyError:
@@ -326,9 +611,16 @@ class Document:
                 'cannot add version for "%s": unknown asset_id' % asset_id
             ) from None
 
+        # apenas a última versão é alterada, então basta atualizar a sua
+        # entrada no cache em vez de invalidá-lo por completo.
+        self._manifest = manifest
+        latest_assets[asset_id] = data_url
+
 
 class BundleManifest:
     """Namespace para funções que manipulam maços.
+
+    Assim como em `DocumentManifest`, o maço recebido nunca é modificado.
     """
 
     @staticmethod
@@ -349,12 +641,26 @@ class BundleManifest:
         value: Union[dict, str],
         now: Callable[[], str] = utcnow,
     ) -> dict:
-        _bundle = deepcopy(bundle)
         _now = now()
-        metadata = _bundle["metadata"].setdefault(name, [])
-        metadata.append((_now, value))
-        _bundle["updated"] = _now
-        return _bundle
+        _metadata = bundle["metadata"]
+        return {
+            **bundle,
+            "metadata": {**_metadata, name: _metadata.get(name, []) + [(_now, value)]},
+            "updated": _now,
+        }
+
+    @staticmethod
+    def update_metadata(
+        bundle: dict, items: Dict[str, Any], now: Callable[[], str] = utcnow
+    ) -> dict:
+        """Equivalente a `set_metadata` aplicado a cada par de `items`, mas
+        produzindo um único manifesto e um único instante de atualização.
+        """
+        _now = now()
+        _metadata = dict(bundle["metadata"])
+        for name, value in items.items():
+            _metadata[name] = _metadata.get(name, []) + [(_now, value)]
+        return {**bundle, "metadata": _metadata, "updated": _now}
 
     @staticmethod
     def get_metadata(bundle: dict, name: str, default="") -> Any:
@@ -373,10 +679,7 @@ class BundleManifest:
             raise exceptions.AlreadyExists(
                 'cannot add item "%s" in bundle: ' "the item already exists" % item
             )
-        _bundle = deepcopy(bundle)
-        _bundle["items"].append(item)
-        _bundle["updated"] = now()
-        return _bundle
+        return {**bundle, "items": bundle["items"] + [item], "updated": now()}
 
     @staticmethod
     def insert_item(
@@ -386,10 +689,9 @@ class BundleManifest:
             raise exceptions.AlreadyExists(
                 'cannot insert item "%s" in bundle: ' "the item already exists" % item
             )
-        _items_bundle = deepcopy(items_bundle)
-        _items_bundle["items"].insert(index, item)
-        _items_bundle["updated"] = now()
-        return _items_bundle
+        _items = list(items_bundle["items"])
+        _items.insert(index, item)
+        return {**items_bundle, "items": _items, "updated": now()}
 
     @staticmethod
     def remove_item(
@@ -399,19 +701,15 @@ class BundleManifest:
             raise exceptions.DoesNotExist(
                 'cannot remove item "%s" from bundle: ' "the item does not exist" % item
             )
-        _items_bundle = deepcopy(items_bundle)
-        _items_bundle["items"].remove(item)
-        _items_bundle["updated"] = now()
-        return _items_bundle
+        _items = list(items_bundle["items"])
+        _items.remove(item)
+        return {**items_bundle, "items": _items, "updated": now()}
 
     @staticmethod
     def set_component(
         components_bundle: dict, name: str, value: Any, now: Callable[[], str] = utcnow
     ) -> None:
-        _components_bundle = deepcopy(components_bundle)
-        _components_bundle[name] = value
-        _components_bundle["updated"] = now()
-        return _components_bundle
+        return {**components_bundle, name: value, "updated": now()}
 
     @staticmethod
     def get_component(components_bundle: dict, name: str, default: str = "") -> Any:
@@ -419,7 +717,7 @@ class BundleManifest:
 
     @staticmethod
     def remove_component(components_bundle: dict, name: str) -> dict:
-        _components_bundle = deepcopy(components_bundle)
+        _components_bundle = dict(components_bundle)
         try:
             del _components_bundle[name]
         except KeyError:
@@ -431,6 +729,145 @@ class BundleManifest:
             return _components_bundle
 
 
+def _bundle_data(manifest: dict) -> dict:
+    """Produz a representação de um maço com os metadados em sua última versão.
+
+    Apenas os dicionários alterados são reconstruídos; os demais valores são
+    compartilhados com `manifest` e devem ser tratados como somente leitura.
+    """
+    return {
+        **manifest,
+        "metadata": {
+            attr: value[-1][-1] for attr, value in manifest["metadata"].items()
+        },
+        "items": list(manifest["items"]),
+    }
+
+
+class _MetadataProperty(property):
+    """Propriedade que lê e escreve o metadado `name` do maço.
+
+    O valor atribuído passa por `coerce`, responsável por normalizá-lo e por
+    lançar a exceção adequada quando o valor não for válido.
+    """
+
+    def __init__(self, name: str, default: Any = "", coerce: Callable = str):
+        def getter(entity):
+            return BundleManifest.get_metadata(entity._manifest, name, default)
+
+        def setter(entity, value):
+            entity.manifest = BundleManifest.set_metadata(
+                entity._manifest, name, coerce(value)
+            )
+
+        super().__init__(getter, setter)
+        self.name = name
+        self.coerce = coerce
+
+
+def _coerce_dict(name: str, describe: Callable[[Any], str] = str) -> Callable:
+    """Produz a função que converte em `dict` os valores do metadado `name`.
+    """
+
+    def coerce(value):
+        try:
+            return dict(value)
+        except (TypeError, ValueError):
+            raise TypeError(
+                f"cannot set {name} with value "
+                '"%s": value must be dict' % describe(value)
+            ) from None
+
+    return coerce
+
+
+def _update_metadata(entity, metadata: Dict[str, Any]) -> None:
+    """Atribui os valores de `metadata` às propriedades homônimas de `entity`.
+    Os metadados são validados e gravados de uma só vez, produzindo um único
+    manifesto; as demais propriedades são atribuídas individualmente.
+    """
+    items = {}
+    others = {}
+    for name, value in metadata.items():
+        attribute = getattr(type(entity), name, None)
+        if isinstance(attribute, _MetadataProperty):
+            items[attribute.name] = attribute.coerce(value)
+        else:
+            others[name] = value
+
+    if items:
+        entity.manifest = BundleManifest.update_metadata(entity._manifest, items)
+    for name, value in others.items():
+        setattr(entity, name, value)
+
+
+def _coerce_publication_year(value: Union[str, int]) -> str:
+    _value = str(value)
+    if not _YEAR_REGEX.match(_value):
+        raise ValueError(
+            "cannot set publication_year with value "
+            f'"{_value}": the value is not valid'
+        )
+    return _value
+
+
+def _coerce_subject_areas(value: Iterable[str]) -> tuple:
+    try:
+        value = tuple(value)
+    except (TypeError, ValueError):
+        raise TypeError(
+            "cannot set subject_areas with value "
+            '"%s": value must be tuple' % repr(value)
+        ) from None
+    invalid = [
+        item
+        for item in value
+        if not (isinstance(item, str) and item in _SUBJECT_AREAS_SET)
+    ]
+    if invalid:
+        raise ValueError(
+            "cannot set subject_areas with value %s: " % repr(value)
+            + "%s are not valid" % repr(invalid)
+        )
+    return value
+
+
+def _coerce_sponsors(value: Iterable[dict]) -> Tuple[dict]:
+    try:
+        return tuple([dict(sponsor) for sponsor in value])
+    except TypeError:
+        raise TypeError("cannot set sponsors this type %s" % repr(value)) from None
+
+
+def _coerce_subject_categories(value: Union[list, tuple]) -> list:
+    try:
+        return list(value)
+    except TypeError:
+        raise TypeError(
+            "cannot set subject_categories with value "
+            '"%s": value must be list like object' % value
+        ) from None
+
+
+def _coerce_institution_responsible_for(value: Iterable[str]) -> tuple:
+    try:
+        return tuple(value)
+    except (TypeError, ValueError):
+        raise TypeError(
+            "cannot set institution_responsible_for with value "
+            '"%s": value must be tuple' % repr(value)
+        ) from None
+
+
+def _coerce_contact(value: dict) -> dict:
+    try:
+        return dict(value)
+    except (TypeError, ValueError) as ex:
+        raise type(ex)(
+            "cannot set contact with value %s: value must be dict" % repr(value)
+        ) from None
+
+
 class DocumentsBundle:
     """
     DocumentsBundle representa um conjunto de documentos agnóstico ao modelo de
@@ -438,86 +875,47 @@ class DocumentsBundle:
     e abertos, Ahead of Print, Documentos Provisórios, Erratas e Retratações.
     """
 
+    __slots__ = ("_manifest",)
+
     def __init__(self, id: str = None, manifest: dict = None):
         assert any([id, manifest])
         self.manifest = manifest or BundleManifest.new(id)
 
+    def __deepcopy__(self, memo):
+        new = object.__new__(type(self))
+        new.manifest = _clone(self._manifest)
+        memo[id(self)] = new
+        return new
+
     def id(self):
         return self.manifest.get("id", "")
 
     def data(self):
-        _manifest = self.manifest
-        _manifest["metadata"] = {
-            attr: value[-1][-1] for attr, value in _manifest["metadata"].items()
-        }
-        return _manifest
+        return _bundle_data(self._manifest)
 
     @property
     def manifest(self):
-        return deepcopy(self._manifest)
+        """Manifesto do maço. Deve ser tratado como somente leitura.
+        """
+        return self._manifest
 
     @manifest.setter
     def manifest(self, value: dict):
         self._manifest = value
 
-    @property
-    def publication_year(self):
-        return BundleManifest.get_metadata(self.manifest, "publication_year")
-
-    @publication_year.setter
-    def publication_year(self, value: Union[str, int]):
-        _value = str(value)
-        if not re.match(r"^\d{4}$", _value):
-            raise ValueError(
-                "cannot set publication_year with value "
-                f'"{_value}": the value is not valid'
-            )
-        self.manifest = BundleManifest.set_metadata(
-            self._manifest, "publication_year", _value
-        )
-
-    @property
-    def volume(self):
-        return BundleManifest.get_metadata(self.manifest, "volume")
-
-    @volume.setter
-    def volume(self, value: Union[str, int]):
-        _value = str(value)
-        self.manifest = BundleManifest.set_metadata(self._manifest, "volume", _value)
-
-    @property
-    def number(self):
-        return BundleManifest.get_metadata(self.manifest, "number")
-
-    @number.setter
-    def number(self, value: Union[str, int]):
-        _value = str(value)
-        self.manifest = BundleManifest.set_metadata(self._manifest, "number", _value)
-
-    @property
-    def supplement(self):
-        return BundleManifest.get_metadata(self.manifest, "supplement")
-
-    @supplement.setter
-    def supplement(self, value: Union[str, int]):
-        _value = str(value)
-        self.manifest = BundleManifest.set_metadata(
-            self._manifest, "supplement", _value
-        )
-
-    @property
-    def titles(self):
-        return BundleManifest.get_metadata(self.manifest, "titles", {})
-
-    @titles.setter
-    def titles(self, value: dict):
-        try:
-            _value = dict(value)
-        except (TypeError, ValueError):
-            raise TypeError(
-                "cannot set titles with value " '"%s": value must be dict' % value
-            ) from None
-        self.manifest = BundleManifest.set_metadata(self._manifest, "titles", _value)
+    publication_year = _MetadataProperty(
+        "publication_year", "", _coerce_publication_year
+    )
+    volume = _MetadataProperty("volume")
+    number = _MetadataProperty("number")
+    supplement = _MetadataProperty("supplement")
+    titles = _MetadataProperty("titles", {}, _coerce_dict("titles"))
+
+    def update_metadata(self, metadata: Dict[str, Any]) -> None:
+        """Atualiza de uma só vez os metadados em `metadata`, aplicando as
+        mesmas validações das propriedades homônimas.
+        """
+        _update_metadata(self, metadata)
 
     def add_document(self, document: str):
         self.manifest = BundleManifest.add_item(self._manifest, document)
@@ -539,10 +937,18 @@ class Journal:
     DocumentsBundle.
     """
 
+    __slots__ = ("_manifest",)
+
     def __init__(self, id: str = None, manifest: dict = None):
         assert any([id, manifest])
         self.manifest = manifest or BundleManifest.new(id)
 
+    def __deepcopy__(self, memo):
+        new = object.__new__(type(self))
+        new.manifest = _clone(self._manifest)
+        memo[id(self)] = new
+        return new
+
     def id(self):
         return self.manifest.get("id", "")
 
@@ -554,7 +960,9 @@ class Journal:
 
     @property
     def manifest(self):
-        return deepcopy(self._manifest)
+        """Manifesto do maço. Deve ser tratado como somente leitura.
+        """
+        return self._manifest
 
     @manifest.setter
     def manifest(self, value: dict):
@@ -563,285 +971,50 @@ class Journal:
     def data(self):
         """Retorna o manifesto completo de um Journal com os
         metadados em sua última versão"""
-        _manifest = self.manifest
-
-        for key, value in _manifest["metadata"].items():
-            _manifest["metadata"][key] = value[-1][-1]
-
-        return _manifest
-
-    @property
-    def mission(self):
-        return BundleManifest.get_metadata(self.manifest, "mission", {})
-
-    @mission.setter
-    def mission(self, value: dict):
-        try:
-            value = dict(value)
-        except (TypeError, ValueError):
-            raise TypeError(
-                "cannot set mission with value " '"%s": value must be dict' % value
-            ) from None
-        self.manifest = BundleManifest.set_metadata(self._manifest, "mission", value)
-
-    @property
-    def title(self):
-        return BundleManifest.get_metadata(self.manifest, "title")
-
-    @title.setter
-    def title(self, value: str):
-        _value = str(value)
-        self.manifest = BundleManifest.set_metadata(self._manifest, "title", _value)
-
-    @property
-    def title_iso(self):
-        return BundleManifest.get_metadata(self.manifest, "title_iso")
-
-    @title_iso.setter
-    def title_iso(self, value: str):
-        _value = str(value)
-        self.manifest = BundleManifest.set_metadata(self._manifest, "title_iso", _value)
-
-    @property
-    def short_title(self):
-        return BundleManifest.get_metadata(self.manifest, "short_title")
-
-    @short_title.setter
-    def short_title(self, value: str):
-        _value = str(value)
-        self.manifest = BundleManifest.set_metadata(
-            self._manifest, "short_title", _value
-        )
-
-    @property
-    def title_slug(self):
-        return BundleManifest.get_metadata(self.manifest, "title_slug")
-
-    @title_slug.setter
-    def title_slug(self, value: str):
-        _value = str(value)
-        self.manifest = BundleManifest.set_metadata(
-            self._manifest, "title_slug", _value
-        )
-
-    @property
-    def acronym(self):
-        return BundleManifest.get_metadata(self.manifest, "acronym")
-
-    @acronym.setter
-    def acronym(self, value: str):
-        _value = str(value)
-        self.manifest = BundleManifest.set_metadata(self._manifest, "acronym", _value)
-
-    @property
-    def scielo_issn(self):
-        return BundleManifest.get_metadata(self.manifest, "scielo_issn")
-
-    @scielo_issn.setter
-    def scielo_issn(self, value: str):
-        _value = str(value)
-        self.manifest = BundleManifest.set_metadata(
-            self._manifest, "scielo_issn", _value
-        )
-
-    @property
-    def print_issn(self):
-        return BundleManifest.get_metadata(self.manifest, "print_issn")
-
-    @print_issn.setter
-    def print_issn(self, value: str):
-        _value = str(value)
-        self.manifest = BundleManifest.set_metadata(
-            self._manifest, "print_issn", _value
-        )
-
-    @property
-    def electronic_issn(self):
-        return BundleManifest.get_metadata(self.manifest, "electronic_issn")
-
-    @electronic_issn.setter
-    def electronic_issn(self, value: str):
-        _value = str(value)
-        self.manifest = BundleManifest.set_metadata(
-            self._manifest, "electronic_issn", _value
-        )
-
-    @property
-    def status(self):
-        return BundleManifest.get_metadata(self.manifest, "status")
-
-    @status.setter
-    def status(self, value: dict):
-        try:
-            value = dict(value)
-        except (TypeError, ValueError):
-            raise TypeError(
-                "cannot set status with value " '"%s": value must be dict' % repr(value)
-            ) from None
-        self.manifest = BundleManifest.set_metadata(self._manifest, "status", value)
-
-    @property
-    def subject_areas(self):
-        return BundleManifest.get_metadata(self.manifest, "subject_areas")
-
-    @subject_areas.setter
-    def subject_areas(self, value: tuple):
-        try:
-            value = tuple(value)
-        except (TypeError, ValueError):
-            raise TypeError(
-                "cannot set subject_areas with value "
-                '"%s": value must be tuple' % repr(value)
-            ) from None
-        invalid = [item for item in value if item not in SUBJECT_AREAS]
-        if invalid:
-            raise ValueError(
-                "cannot set subject_areas with value %s: " % repr(value)
-                + "%s are not valid" % repr(invalid)
-            )
-        self.manifest = BundleManifest.set_metadata(
-            self._manifest, "subject_areas", value
-        )
-
-    @property
-    def sponsors(self) -> Tuple[dict]:
-        return BundleManifest.get_metadata(self.manifest, "sponsors")
-
-    @sponsors.setter
-    def sponsors(self, value: Tuple[dict]) -> None:
-        try:
-            value = tuple([dict(sponsor) for sponsor in value])
-        except TypeError:
-            raise TypeError("cannot set sponsors this type %s" % repr(value)) from None
-
-        self.manifest = BundleManifest.set_metadata(self._manifest, "sponsors", value)
-
-    @property
-    def metrics(self):
-        return BundleManifest.get_metadata(self.manifest, "metrics", {})
-
-    @metrics.setter
-    def metrics(self, value: dict):
-        try:
-            value = dict(value)
-        except (TypeError, ValueError):
-            raise TypeError(
-                "cannot set metrics with value " '"%s": value must be dict' % value
-            ) from None
-        self.manifest = BundleManifest.set_metadata(self._manifest, "metrics", value)
-
-    @property
-    def subject_categories(self):
-        return BundleManifest.get_metadata(self.manifest, "subject_categories")
-
-    @subject_categories.setter
-    def subject_categories(self, value: Union[list, tuple]):
-        try:
-            value = list(value)
-        except TypeError:
-            raise TypeError(
-                "cannot set subject_categories with value "
-                '"%s": value must be list like object' % value
-            ) from None
-
-        self.manifest = BundleManifest.set_metadata(
-            self._manifest, "subject_categories", list(value)
-        )
-
-    @property
-    def institution_responsible_for(self):
-        return BundleManifest.get_metadata(
-            self.manifest, "institution_responsible_for", ()
-        )
-
-    @institution_responsible_for.setter
-    def institution_responsible_for(self, value: tuple):
-        try:
-            value = tuple(value)
-        except (TypeError, ValueError):
-            raise TypeError(
-                "cannot set institution_responsible_for with value "
-                '"%s": value must be tuple' % repr(value)
-            ) from None
-
-        self.manifest = BundleManifest.set_metadata(
-            self.manifest, "institution_responsible_for", value
-        )
-
-    @property
-    def online_submission_url(self):
-        return BundleManifest.get_metadata(self.manifest, "online_submission_url")
-
-    @online_submission_url.setter
-    def online_submission_url(self, value: str):
-        _value = str(value)
-        self.manifest = BundleManifest.set_metadata(
-            self._manifest, "online_submission_url", _value
-        )
-
-    @property
-    def next_journal(self):
-        return BundleManifest.get_metadata(self.manifest, "next_journal", {})
-
-    @next_journal.setter
-    def next_journal(self, value: dict):
-        try:
-            value = dict(value)
-        except (TypeError, ValueError):
-            raise TypeError(
-                "cannot set next_journal with value "
-                '"%s": value must be dict' % repr(value)
-            ) from None
-        self.manifest = BundleManifest.set_metadata(
-            self._manifest, "next_journal", value
-        )
-
-    @property
-    def logo_url(self):
-        return BundleManifest.get_metadata(self.manifest, "logo_url")
-
-    @logo_url.setter
-    def logo_url(self, value: str):
-        value = str(value)
-        self.manifest = BundleManifest.set_metadata(self._manifest, "logo_url", value)
-
-    @property
-    def previous_journal(self):
-        return BundleManifest.get_metadata(self.manifest, "previous_journal", {})
-
-    @previous_journal.setter
-    def previous_journal(self, value: dict):
-        try:
-            value = dict(value)
-        except (TypeError, ValueError):
-            raise TypeError(
-                "cannot set previous_journal with value "
-                '"%s": value must be dict' % repr(value)
-            ) from None
-        self.manifest = BundleManifest.set_metadata(
-            self._manifest, "previous_journal", value
-        )
+        return _bundle_data(self._manifest)
+
+    mission = _MetadataProperty("mission", {}, _coerce_dict("mission"))
+    title = _MetadataProperty("title")
+    title_iso = _MetadataProperty("title_iso")
+    short_title = _MetadataProperty("short_title")
+    title_slug = _MetadataProperty("title_slug")
+    acronym = _MetadataProperty("acronym")
+    scielo_issn = _MetadataProperty("scielo_issn")
+    print_issn = _MetadataProperty("print_issn")
+    electronic_issn = _MetadataProperty("electronic_issn")
+    status = _MetadataProperty("status", "", _coerce_dict("status", repr))
+
+    subject_areas = _MetadataProperty("subject_areas", "", _coerce_subject_areas)
+    sponsors = _MetadataProperty("sponsors", "", _coerce_sponsors)
+
+    metrics = _MetadataProperty("metrics", {}, _coerce_dict("metrics"))
+
+    subject_categories = _MetadataProperty(
+        "subject_categories", "", _coerce_subject_categories
+    )
+    institution_responsible_for = _MetadataProperty(
+        "institution_responsible_for", (), _coerce_institution_responsible_for
+    )
+    online_submission_url = _MetadataProperty("online_submission_url")
+    next_journal = _MetadataProperty(
+        "next_journal", {}, _coerce_dict("next_journal", repr)
+    )
+    logo_url = _MetadataProperty("logo_url")
+    previous_journal = _MetadataProperty(
+        "previous_journal", {}, _coerce_dict("previous_journal", repr)
+    )
 
     @property
     def status_history(self):
         return BundleManifest.get_metadata_all(self.manifest, "status")
 
-    @property
-    def contact(self) -> dict:
-        return BundleManifest.get_metadata(self.manifest, "contact", {})
+    contact = _MetadataProperty("contact", {}, _coerce_contact)
 
-    @contact.setter
-    def contact(self, value: dict) -> None:
-        try:
-            value = dict(value)
-        except (TypeError, ValueError) as ex:
-            raise type(ex)(
-                "cannot set contact with value "
-                "%s"
-                ": value must be dict" % repr(value)
-            ) from None
-
-        self.manifest = BundleManifest.set_metadata(self._manifest, "contact", value)
+    def update_metadata(self, metadata: Dict[str, Any]) -> None:
+        """Atualiza de uma só vez os metadados em `metadata`, aplicando as
+        mesmas validações das propriedades homônimas.
+        """
+        _update_metadata(self, metadata)
 
     def add_issue(self, issue: str) -> None:
         self.manifest = BundleManifest.add_item(self._manifest, issue)
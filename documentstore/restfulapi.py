@@ -1,5 +1,13 @@
 import logging
 import os
+import re
+import threading
+from typing import Any, Callable
+from collections import OrderedDict
+import functools
+import hashlib
+import json
+from datetime import datetime, timezone
 
 from pyramid.config import Configurator
 from pyramid.httpexceptions import (
@@ -8,7 +16,12 @@ from pyramid.httpexceptions import (
     HTTPNoContent,
     HTTPCreated,
     HTTPBadRequest,
+    HTTPTooManyRequests,
+    HTTPNotModified,
 )
+from pyramid.response import Response
+from webob.datetime_utils import parse_date
+from webob.etag import ETagMatcher
 from cornice import Service
 from cornice.validators import colander_body_validator
 from cornice.service import get_services
@@ -16,12 +29,23 @@ import colander
 from slugify import slugify
 from cornice_swagger import CorniceSwagger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from . import services
 from . import adapters
 from . import exceptions
+from .domain import utcnow, Document
 
 LOGGER = logging.getLogger(__name__)
 
+CACHE_CONTROL_IMMUTABLE = "public, max-age=31536000, immutable"
+CACHE_CONTROL_DEFAULT = "public, max-age=60, stale-while-revalidate=60"
+DIFF_RETRY_AFTER = "1"
+NOT_MODIFIED_HEADERS = ("ETag", "Cache-Control", "Last-Modified", "Expires", "Vary")
+
 swagger = Service(
     name="Kernel API", path="/__api__", description="Kernel API documentation"
 )
@@ -90,6 +114,23 @@ journals_aop = Service(
     description="Manipulate ahead of print in journal",
 )
 
+# serviços registrados explicitamente em `main`, dispensando a varredura do
+# pacote com `config.scan()` durante a inicialização da app.
+SERVICES = (
+    swagger,
+    documents,
+    manifest,
+    assets_list,
+    assets,
+    diff,
+    front,
+    bundles,
+    changes,
+    journals,
+    journal_issues,
+    journals_aop,
+)
+
 
 class ResponseSchema(colander.MappingSchema):
     body = colander.SchemaNode(colander.String(), missing=colander.drop)
@@ -135,6 +176,92 @@ class AssetSchema(colander.MappingSchema):
     asset_url = colander.SchemaNode(colander.String(), validator=colander.url)
 
 
+@functools.lru_cache(maxsize=8192)
+def _matches_url(value: str) -> bool:
+    """Aplica a expressão regular de `colander.url`, cujo custo é alto se
+    comparado ao restante da validação. As URLs dos ativos tendem a se repetir
+    entre registros de versões do mesmo documento.
+    """
+    return colander.url.match_object.match(value) is not None
+
+
+def _is_url(value) -> bool:
+    return isinstance(value, str) and _matches_url(value)
+
+
+def _validate_register_document(body) -> dict:
+    """Equivalente a `RegisterDocumentSchema().deserialize(body)` para corpos
+    válidos. Retorna `None` caso `body` não seja aceito de imediato.
+    """
+    try:
+        data_url = body["data"]
+        assets = body["assets"]
+    except (TypeError, KeyError):
+        return None
+    if not (_is_url(data_url) and isinstance(assets, list)):
+        return None
+
+    validated_assets = []
+    for asset in assets:
+        try:
+            asset_id = asset["asset_id"]
+            asset_url = asset["asset_url"]
+        except (TypeError, KeyError):
+            return None
+        if not (isinstance(asset_id, str) and asset_id and _is_url(asset_url)):
+            return None
+        validated_assets.append({"asset_id": asset_id, "asset_url": asset_url})
+
+    return {"data": data_url, "assets": validated_assets}
+
+
+def _validate_asset(body) -> dict:
+    """Equivalente a `AssetSchema().deserialize(body)` para corpos válidos.
+    Retorna `None` caso `body` não seja aceito de imediato.
+    """
+    try:
+        asset_url = body["asset_url"]
+    except (TypeError, KeyError):
+        return None
+    if not _is_url(asset_url):
+        return None
+    return {"asset_url": asset_url}
+
+
+_JSON_CONTENT_TYPE_REGEX = re.compile(r"^application/(.*?)json$")
+
+
+def _json_body(request):
+    """Obtém o corpo da requisição em JSON, ou `None` caso não seja possível.
+    """
+    content_type = request.content_type
+    if content_type and not _JSON_CONTENT_TYPE_REGEX.match(content_type):
+        return None
+    try:
+        return request.json_body
+    except ValueError:
+        return None
+
+
+def fast_body_validator(validate: Callable[[Any], dict]) -> Callable:
+    """Produz um validador de corpo de requisição que, para os casos comuns,
+    dispensa a travessia dos nós do schema Colander.
+
+    `validate` recebe o corpo da requisição e retorna os dados validados, como
+    seriam produzidos pelo schema, ou `None` caso não seja capaz de aceitá-lo.
+    Nesse caso a validação é delegada ao `colander_body_validator`, que produz
+    as mensagens de erro.
+    """
+
+    def validator(request, **kwargs):
+        validated = validate(_json_body(request))
+        if validated is None:
+            return colander_body_validator(request, **kwargs)
+        request.validated.update(validated)
+
+    return validator
+
+
 class JournalSchema(colander.MappingSchema):
     """Representa o schema de dados para registro de periódicos.
     """
@@ -279,6 +406,136 @@ class DeleteJournalIssuesSchema(colander.MappingSchema):
     issue = colander.SchemaNode(colander.String())
 
 
+def _etag(*parts: str) -> str:
+    return hashlib.md5("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def _version_etag(document_id: str, version: dict) -> str:
+    """Produz a ETag a partir do conteúdo de `version`, de maneira que o registro
+    de versões posteriores não a altere.
+    """
+    data_url, assets = services._version_content_key(version)
+    return _etag(document_id, data_url, *(part for asset in assets for part in asset))
+
+
+def _last_modified(manifest: dict) -> str:
+    """Obtém o timestamp da alteração mais recente do documento, seja o
+    registro de uma nova versão ou de uma nova versão de um de seus ativos.
+    Toda alteração é registrada na última versão do documento.
+    """
+    try:
+        version = manifest["versions"][-1]
+    except (KeyError, IndexError):
+        return ""
+    return max(
+        [version["timestamp"]]
+        + [uri[0] for uris in version["assets"].values() for uri in uris]
+    )
+
+
+def _parse_timestamp(timestamp: str):
+    try:
+        return datetime.fromisoformat(timestamp.rstrip("Z")).replace(
+            tzinfo=timezone.utc
+        )
+    except ValueError:
+        return None
+
+
+_DATE_REGEX = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def _is_immutable(when: str) -> bool:
+    """Versões obtidas por meio de um instante no passado não serão mais
+    alteradas, já que novas versões sempre são registradas no instante
+    corrente.
+
+    Assim como em `Document.version_at`, datas sem horário correspondem ao
+    último instante do dia.
+    """
+    if not when:
+        return False
+    if _DATE_REGEX.match(when):
+        when = f"{when}T23:59:59.999999Z"
+    return when < utcnow()
+
+
+def _set_cache_headers(
+    request, etag: str, last_modified: str = "", immutable: bool = False
+) -> bool:
+    """Define os cabeçalhos de cache HTTP da resposta e retorna `True` caso a
+    representação mantida pelo cliente, de acordo com os cabeçalhos
+    ``If-None-Match`` e ``If-Modified-Since`` da requisição, ainda seja válida.
+    """
+    response = request.response
+    response.etag = etag
+    response.headers["Cache-Control"] = (
+        CACHE_CONTROL_IMMUTABLE if immutable else CACHE_CONTROL_DEFAULT
+    )
+    last_modified_at = _parse_timestamp(last_modified) if last_modified else None
+    if last_modified_at is not None:
+        response.last_modified = last_modified_at
+
+    # comparação fraca (RFC 7232, seção 2.3.2), tal qual `Request.if_none_match`
+    # do WebOb, para que validadores ``W/"..."`` também sejam reconhecidos.
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match:
+        return etag in ETagMatcher.parse(if_none_match, strong=False)
+
+    if_modified_since = parse_date(request.headers.get("If-Modified-Since"))
+    if if_modified_since and last_modified_at:
+        return last_modified_at.replace(microsecond=0) <= if_modified_since
+
+    return False
+
+
+def _not_modified(request) -> HTTPNotModified:
+    """Produz a resposta 304 com os cabeçalhos de cache que seriam enviados na
+    resposta 200 (RFC 7232, seção 4.1), sem os metadados da representação.
+    """
+    headers = request.response.headers
+    return HTTPNotModified(
+        headers=[
+            (name, headers[name]) for name in NOT_MODIFIED_HEADERS if name in headers
+        ]
+    )
+
+
+class _LRUCache:
+    """Cache em memória limitado a `maxsize` entradas, com descarte das
+    entradas usadas menos recentemente. Pode ser compartilhado entre threads.
+    """
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+
+    def set(self, key, value) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# conteúdo de versões de documentos obtidas por meio de instantes no passado,
+# na forma ``(document_id, when) -> (etag, data)``.
+_IMMUTABLE_DOCUMENT_DATA = _LRUCache(maxsize=1024)
+
+
 @documents.get(
     schema=DocumentSchema(),
     response_schemas={
@@ -294,22 +551,59 @@ def fetch_document_data(request):
     versão do documento. Produzirá uma resposta com o código HTTP 404 caso o
     documento solicitado não seja conhecido pela aplicação.
     """
+    document_id = request.matchdict["document_id"]
     when = request.GET.get("when", None)
     if when:
         version = {"version_at": when}
     else:
         version = {}
+
+    immutable = _is_immutable(when)
+    if immutable:
+        cached = _IMMUTABLE_DOCUMENT_DATA.get((document_id, when))
+        if cached is not None:
+            etag, data = cached
+            if _set_cache_headers(request, etag, immutable=True):
+                return _not_modified(request)
+            return data
+
     try:
-        return request.services["fetch_document_data"](
-            id=request.matchdict["document_id"], **version
+        _manifest = request.services["fetch_document_manifest"](id=document_id)
+    except exceptions.DoesNotExist as exc:
+        raise HTTPNotFound(exc)
+
+    last_modified = _last_modified(_manifest)
+    if when:
+        try:
+            version_at = Document(manifest=_manifest).version_at(when)
+        except ValueError as exc:
+            raise HTTPNotFound(exc)
+        etag = _version_etag(_manifest["id"], version_at)
+    else:
+        etag = _etag(_manifest["id"], last_modified)
+    if _set_cache_headers(
+        request,
+        etag,
+        last_modified="" if immutable else last_modified,
+        immutable=immutable,
+    ):
+        return _not_modified(request)
+
+    try:
+        data = request.services["render_document_data_chunks"](
+            manifest=_manifest, **version
         )
     except (exceptions.DoesNotExist, ValueError) as exc:
         raise HTTPNotFound(exc)
 
+    if immutable:
+        _IMMUTABLE_DOCUMENT_DATA.set((document_id, when), (etag, data))
+    return data
+
 
 @documents.put(
     schema=RegisterDocumentSchema(),
-    validators=(colander_body_validator,),
+    validators=(fast_body_validator(_validate_register_document),),
     response_schemas={
         "201": RegisterDocumentSchema(description="Documento criado com sucesso"),
         "204": RegisterDocumentSchema(description="Documento atualizado com sucesso"),
@@ -328,29 +622,23 @@ def put_document(request):
     requisição subsequente para o mesmo recurso produzirá respostas com o código
     HTTP 204 No Content.
     """
-    data_url = request.validated["data"]
+    document_id = request.matchdict["document_id"]
+    validated = request.validated
     assets = {
-        asset["asset_id"]: asset["asset_url"]
-        for asset in request.validated.get("assets", [])
+        asset["asset_id"]: asset["asset_url"] for asset in validated.get("assets", ())
     }
-    try:
-        request.services["register_document"](
-            id=request.matchdict["document_id"], data_url=data_url, assets=assets
-        )
-    except exceptions.AlreadyExists:
-        try:
-            request.services["register_document_version"](
-                id=request.matchdict["document_id"], data_url=data_url, assets=assets
-            )
-        except exceptions.VersionAlreadySet as exc:
-            LOGGER.info(
-                'skipping request to add version to "%s": %s',
-                request.matchdict["document_id"],
-                exc,
-            )
-        return HTTPNoContent("document updated successfully")
-    else:
+    result = request.services["upsert_document"](
+        id=document_id, data_url=validated["data"], assets=assets
+    )
+    if result is services.UpsertResult.CREATED:
         return HTTPCreated("document created successfully")
+    elif result is services.UpsertResult.UNCHANGED:
+        LOGGER.info(
+            'skipping request to add version to "%s": '
+            "the version is equal to the latest one",
+            document_id,
+        )
+    return HTTPNoContent("document updated successfully")
 
 
 @manifest.get(
@@ -367,20 +655,51 @@ def get_manifest(request):
     HTTP 404 caso o documento não seja conhecido pela aplicação.
     """
     try:
-        return request.services["fetch_document_manifest"](
+        _manifest = request.services["fetch_document_manifest"](
             id=request.matchdict["document_id"]
         )
     except exceptions.DoesNotExist as exc:
         raise HTTPNotFound(exc)
 
+    last_modified = _last_modified(_manifest)
+    if _set_cache_headers(
+        request, _etag(_manifest["id"], last_modified), last_modified=last_modified
+    ):
+        return _not_modified(request)
+    return _manifest
+
 
-def slugify_assets_ids(assets, slug_fn=slugify):
+@functools.lru_cache(maxsize=8192)
+def _slugify_asset_id(asset_id: str) -> str:
+    """Versão memorizada de `slugify`, que é uma função pura porém custosa e
+    é aplicada a todos os ativos do documento a cada requisição.
+    """
+    return slugify(asset_id)
+
+
+def slugify_assets_ids(assets, slug_fn=_slugify_asset_id):
     return [
         {"slug": slug_fn(asset_id), "id": asset_id, "url": asset_url}
         for asset_id, asset_url in assets.items()
     ]
 
 
+@functools.lru_cache(maxsize=128)
+def _slugify_assets_items(items: tuple) -> list:
+    """Versão memorizada de `slugify_assets_ids` a partir dos pares
+    ``(id, url)`` dos ativos. A lista produzida é compartilhada entre as
+    requisições e não deve ser modificada.
+    """
+    return slugify_assets_ids(dict(items))
+
+
+def _fetch_assets_list(request, document_id: str) -> dict:
+    try:
+        return request.services["fetch_assets_list"](id=document_id)
+    except exceptions.DoesNotExist as exc:
+        raise HTTPNotFound(exc)
+
+
 @assets_list.get(
     accept="application/json",
     renderer="json",
@@ -394,20 +713,32 @@ def get_assets_list(request):
     versão. Produzirá uma resposta com o código HTTP 404 caso o documento não
     seja conhecido pela aplicação.
     """
-    try:
-        assets = request.services["fetch_assets_list"](
-            id=request.matchdict["document_id"]
-        )
-    except exceptions.DoesNotExist as exc:
-        raise HTTPNotFound(exc)
+    document_id = request.matchdict["document_id"]
+    assets = _fetch_assets_list(request, document_id)
 
-    assets["assets"] = slugify_assets_ids(assets["assets"])
+    # a versão não registra o instante de atualização dos seus ativos, então a
+    # etag é derivada do seu conteúdo.
+    etag = _etag(document_id, json.dumps(assets, sort_keys=True, separators=(",", ":")))
+    if _set_cache_headers(request, etag):
+        return _not_modified(request)
+
+    assets["assets"] = _slugify_assets_items(tuple(assets["assets"].items()))
     return assets
 
 
+def _asset_id_by_slug(assets: dict, slug: str, slug_fn=_slugify_asset_id):
+    """Obtém o identificador do ativo de `assets` cujo slug é `slug`, ou
+    `None` caso não exista. Em caso de colisão prevalece o último ativo.
+    """
+    for asset_id in reversed(list(assets)):
+        if slug_fn(asset_id) == slug:
+            return asset_id
+    return None
+
+
 @assets.put(
     schema=AssetSchema(),
-    validators=(colander_body_validator,),
+    validators=(fast_body_validator(_validate_asset),),
     response_schemas={
         "204": AssetSchema(
             description="Adicionado ou atualizado o ativo digital com sucesso"
@@ -422,26 +753,27 @@ def put_asset(request):
     A semântica desta view-function está definida conforme a especificação:
     https://www.w3.org/Protocols/rfc2616/rfc2616-sec9.html#sec9.6
     """
-    assets_list = get_assets_list(request)
-    assets_map = {asset["slug"]: asset["id"] for asset in assets_list["assets"]}
+    document_id = request.matchdict["document_id"]
     asset_slug = request.matchdict["asset_slug"]
-    try:
-        asset_id = assets_map[asset_slug]
-    except KeyError:
+    asset_id = _asset_id_by_slug(
+        _fetch_assets_list(request, document_id)["assets"], asset_slug
+    )
+    if asset_id is None:
         raise HTTPNotFound(
             'cannot fetch asset with slug "%s": asset does not exist' % asset_slug
         )
 
-    asset_url = request.validated["asset_url"]
     try:
         request.services["register_asset_version"](
-            id=request.matchdict["document_id"], asset_id=asset_id, asset_url=asset_url
+            id=document_id,
+            asset_id=asset_id,
+            asset_url=request.validated["asset_url"],
         )
     except exceptions.VersionAlreadySet as exc:
         LOGGER.info(
             'skipping request to add version to "%s/assets/%s": %s',
-            request.matchdict["document_id"],
-            request.matchdict["asset_slug"],
+            document_id,
+            asset_slug,
             exc,
         )
     return HTTPNoContent("asset updated successfully")
@@ -457,6 +789,9 @@ def put_asset(request):
             description="Erro ao tentar processar a requisição, verifique o valor do parâmetro `from_when`"
         ),
         "404": DiffDocumentSchema(description="Documento não encontrado"),
+        "429": DiffDocumentSchema(
+            description="Excedido o número de comparações simultâneas"
+        ),
     },
     renderer="text",
 )
@@ -467,6 +802,14 @@ def diff_document_versions(request):
     from_when = request.GET.get("from_when", None)
     if from_when is None:
         raise HTTPBadRequest("cannot fetch diff: missing attribute from_when")
+
+    # a comparação é custosa e o número de comparações simultâneas é limitado
+    # para que não ocupem todas as threads do processo.
+    if not request.diff_slots.acquire(blocking=False):
+        raise HTTPTooManyRequests(
+            "cannot fetch diff: too many concurrent requests",
+            headers={"Retry-After": DIFF_RETRY_AFTER},
+        )
     try:
         return request.services["diff_document_versions"](
             id=request.matchdict["document_id"],
@@ -475,6 +818,8 @@ def diff_document_versions(request):
         )
     except (exceptions.DoesNotExist, ValueError) as exc:
         raise HTTPNotFound(exc)
+    finally:
+        request.diff_slots.release()
 
 
 @front.get(
@@ -489,7 +834,9 @@ def diff_document_versions(request):
 )
 def fetch_document_front(request):
     data = fetch_document_data(request)
-    return request.services["sanitize_document_front"](data)
+    if isinstance(data, Response):
+        return data
+    return request.services["sanitize_document_front"](b"".join(data))
 
 
 @bundles.get(
@@ -672,12 +1019,11 @@ def get_journal(request):
     """Recupera um periódico por meio de seu identificador
     """
 
+    journal_id = request.matchdict["journal_id"]
     try:
-        return request.services["fetch_journal"](id=request.matchdict["journal_id"])
+        return request.services["fetch_journal"](id=journal_id)
     except exceptions.DoesNotExist:
-        return HTTPNotFound(
-            'cannot fetch journal with id "%s"' % request.matchdict["journal_id"]
-        )
+        return HTTPNotFound('cannot fetch journal with id "%s"' % journal_id)
 
 
 @journals.patch(
@@ -698,16 +1044,15 @@ def patch_journal(request):
     validados por meio do JournalSchema.
     """
 
+    journal_id = request.matchdict["journal_id"]
     try:
         request.services["update_journal_metadata"](
-            id=request.matchdict["journal_id"], metadata=request.validated
+            id=journal_id, metadata=request.validated
         )
     except (TypeError, ValueError) as exc:
         return HTTPBadRequest(str(exc))
     except exceptions.DoesNotExist:
-        return HTTPNotFound(
-            'cannot fetch journal with id "%s"' % request.matchdict["journal_id"]
-        )
+        return HTTPNotFound('cannot fetch journal with id "%s"' % journal_id)
 
     return HTTPNoContent("journal updated successfully")
 
@@ -725,16 +1070,16 @@ def patch_journal(request):
     renderer="json",
 )
 def patch_journal_issues(request):
+    journal_id = request.matchdict["journal_id"]
+    validated = request.validated
     try:
-        if request.validated.get("index") is not None:
+        if validated.get("index") is not None:
             request.services["insert_issue_to_journal"](
-                id=request.matchdict["journal_id"],
-                index=request.validated["index"],
-                issue=request.validated["issue"],
+                id=journal_id, index=validated["index"], issue=validated["issue"]
             )
         else:
             request.services["add_issue_to_journal"](
-                id=request.matchdict["journal_id"], issue=request.validated["issue"]
+                id=journal_id, issue=validated["issue"]
             )
     except exceptions.DoesNotExist as exc:
         return HTTPNotFound(str(exc))
@@ -757,14 +1102,13 @@ def patch_journal_issues(request):
     renderer="json",
 )
 def patch_journal_aop(request):
+    journal_id = request.matchdict["journal_id"]
     try:
         request.services["set_ahead_of_print_bundle_to_journal"](
-            id=request.matchdict["journal_id"], aop=request.validated["aop"]
+            id=journal_id, aop=request.validated["aop"]
         )
     except exceptions.DoesNotExist:
-        return HTTPNotFound(
-            'cannot find journal with id "%s"' % request.matchdict["journal_id"]
-        )
+        return HTTPNotFound('cannot find journal with id "%s"' % journal_id)
 
     return HTTPNoContent("aop added to journal successfully")
 
@@ -815,19 +1159,28 @@ def delete_journal_issues(request):
         return HTTPNoContent("issue removed from journal successfully.")
 
 
-@swagger.get()
-def openAPI_spec(request):
+@functools.lru_cache(maxsize=1)
+def _openapi_spec_body() -> bytes:
+    """Especificação OpenAPI serializada. Os serviços são definidos durante a
+    importação deste módulo e não mudam, então basta gerá-la uma única vez.
+    """
     doc = CorniceSwagger(get_services())
     doc.summary_docstrings = True
-    return doc.generate("Kernel", "0.1")
+    return json.dumps(doc.generate("Kernel", "0.1")).encode("utf-8")
+
+
+@swagger.get()
+def openAPI_spec(request):
+    return Response(body=_openapi_spec_body(), content_type="application/json")
 
 
 class XMLRenderer:
     """Renderizador para dados do tipo ``text/xml``.
 
-    Espera que o retorno da view-function seja uma string de bytes pronta para
-    ser transferida para o cliente. Este renderer apenas define o content-type
-    da resposta HTTP.
+    Espera que o retorno da view-function seja uma string de bytes, ou uma
+    lista de fragmentos de bytes, pronta para ser transferida para o cliente.
+    Os fragmentos são transmitidos sem que sejam concatenados. Este renderer
+    apenas define o content-type e o content-length da resposta HTTP.
     """
 
     def __init__(self, info):
@@ -836,7 +1189,13 @@ class XMLRenderer:
     def __call__(self, value, system):
         request = system.get("request")
         if request is not None:
-            request.response.content_type = "text/xml"
+            response = request.response
+            response.content_type = "text/xml"
+            if isinstance(value, list):
+                # a atribuição de `app_iter` descarta o content-length.
+                response.app_iter = value
+                response.content_length = sum(map(len, value))
+                return None
         return value
 
 
@@ -858,8 +1217,33 @@ class PlainTextRenderer:
         return value
 
 
+class OrjsonRenderer:
+    """Renderizador para dados do tipo ``application/json`` baseado na
+    biblioteca *orjson*, que serializa diretamente para string de bytes.
+
+    Substitui o renderizador ``json`` do Pyramid quando a biblioteca estiver
+    instalada. Valores que a *orjson* não suporta, como inteiros maiores que 64
+    bits, são serializados por meio do módulo ``json``.
+    """
+
+    def __init__(self, info):
+        pass
+
+    def __call__(self, value, system):
+        request = system.get("request")
+        if request is not None:
+            response = request.response
+            if response.content_type == response.default_content_type:
+                response.content_type = "application/json"
+        try:
+            return orjson.dumps(value)
+        except orjson.JSONEncodeError:
+            return json.dumps(value).encode("utf-8")
+
+
 DEFAULT_SETTINGS = [
-    ("kernel.app.mongodb.dsn", "KERNEL_APP_MONGODB_DSN", str, "mongodb://db:27017/")
+    ("kernel.app.mongodb.dsn", "KERNEL_APP_MONGODB_DSN", str, "mongodb://db:27017/"),
+    ("kernel.app.diff.max_concurrency", "KERNEL_APP_DIFF_MAX_CONCURRENCY", int, 4),
 ]
 
 
@@ -892,15 +1276,24 @@ def main(global_config, **settings):
     config = Configurator(settings=settings)
     config.include("cornice")
     config.include("cornice_swagger")
-    config.scan()
+    for service in SERVICES:
+        config.add_cornice_service(service)
+    _openapi_spec_body()
     config.add_renderer("xml", XMLRenderer)
     config.add_renderer("text", PlainTextRenderer)
+    if orjson is not None:
+        config.add_renderer("json", OrjsonRenderer)
 
     mongo = adapters.MongoDB(settings["kernel.app.mongodb.dsn"])
     Session = adapters.Session.partial(mongo)
 
-    config.add_request_method(
-        lambda request: services.get_handlers(Session), "services", reify=True
-    )
+    # os serviços não mantêm estado entre chamadas, já que cada uma obtém sua
+    # própria instância de `Session`, e por isso são compartilhados por todas
+    # as requisições.
+    handlers = services.get_handlers(Session)
+    config.add_request_method(lambda request: handlers, "services", reify=True)
+
+    diff_slots = threading.BoundedSemaphore(settings["kernel.app.diff.max_concurrency"])
+    config.add_request_method(lambda request: diff_slots, "diff_slots", reify=True)
 
     return config.make_wsgi_app()
@@ -1,4 +1,4 @@
-from typing import Callable, Dict, Any
+from typing import Callable, Dict, Any, List
 import difflib
 import functools
 from io import BytesIO
@@ -7,9 +7,10 @@ from enum import Enum, auto
 from clea import join as clea_join, core as clea_core
 
 from .interfaces import Session
-from .domain import Document, DocumentsBundle, Journal, utcnow
+from . import exceptions
+from .domain import Document, DocumentsBundle, Journal, utcnow, version_data_chunks
 
-__all__ = ["get_handlers"]
+__all__ = ["get_handlers", "UpsertResult"]
 
 
 class Events(Enum):
@@ -32,6 +33,19 @@ class Events(Enum):
     AHEAD_OF_PRINT_BUNDLE_REMOVED_FROM_JOURNAL = auto()
 
 
+def _apply_metadata(entity, metadata: Dict[str, Any]) -> None:
+    """Atribui os valores de `metadata` às propriedades homônimas de `entity`.
+    Metadados que não correspondem a propriedades da entidade são ignorados.
+    """
+    entity.update_metadata(
+        {
+            name: value
+            for name, value in metadata.items()
+            if isinstance(getattr(type(entity), name, None), property)
+        }
+    )
+
+
 class CommandHandler:
     def __init__(self, Session: Callable[[], Session]):
         self.Session = Session
@@ -107,6 +121,67 @@ class RegisterDocumentVersion(BaseRegisterDocument):
         session.notify(Events.DOCUMENT_VERSION_REGISTERED, data)
 
 
+class UpsertResult(Enum):
+    """Resultados possíveis de `UpsertDocument`.
+    """
+
+    CREATED = auto()
+    UPDATED = auto()
+    UNCHANGED = auto()
+
+
+class UpsertDocument(CommandHandler):
+    """Registra um novo documento ou, caso já exista, uma nova versão do
+    documento.
+
+    Equivale a executar `RegisterDocument` e, diante de `AlreadyExists`,
+    `RegisterDocumentVersion`, mas o documento é lido do banco de dados e o
+    XML obtido uma única vez.
+
+    :param id: Identificador alfanumérico para o documento.
+    :param data_url: URL válida e publicamente acessível para o documento em XML
+    SciELO PS.
+    """
+
+    def __call__(
+        self, id: str, data_url: str, assets: Dict[str, str] = None
+    ) -> UpsertResult:
+        try:
+            assets = dict(assets)
+        except TypeError:
+            assets = {}
+        session = self.Session()
+        try:
+            document = session.documents.fetch(id)
+        except exceptions.DoesNotExist:
+            document = Document(id=id)
+            persist = session.documents.add
+            event, result = Events.DOCUMENT_REGISTERED, UpsertResult.CREATED
+        else:
+            persist = session.documents.update
+            event, result = Events.DOCUMENT_VERSION_REGISTERED, UpsertResult.UPDATED
+
+        try:
+            document.new_version(data_url)
+            for asset_id, asset_url in assets.items():
+                document.new_asset_version(asset_id, asset_url)
+        except exceptions.VersionAlreadySet:
+            return UpsertResult.UNCHANGED
+
+        try:
+            persist(document)
+        except exceptions.AlreadyExists:
+            # o documento foi registrado por outra requisição entre a leitura
+            # e a escrita.
+            return self(id, data_url, assets)
+
+        session.notify(
+            event,
+            {"document": document, "id": id, "data_url": data_url, "assets": assets},
+        )
+        return result
+
+
 class FetchDocumentData(CommandHandler):
     """Recupera o documento em XML à partir de seu identificador.
 
@@ -126,6 +201,26 @@ class FetchDocumentData(CommandHandler):
         return document.data(version_index=version_index, version_at=version_at)
 
 
+class RenderDocumentDataChunks(CommandHandler):
+    """Produz o documento em XML, a partir de seu manifesto, como uma lista de
+    fragmentos adequada para a transmissão incremental da resposta. Permite
+    que o manifesto já obtido por meio de `FetchDocumentManifest` seja
+    reaproveitado sem que o documento seja lido novamente.
+
+    :param manifest: Manifesto do documento.
+    :param version_index: (opcional) Número inteiro correspondente a versão do
+    documento. Por padrão retorna a versão mais recente.
+    :param version_at: (opcional) string de texto de um timestamp UTC
+    referente a versão do documento no determinado momento.
+    """
+
+    def __call__(
+        self, manifest: dict, version_index: int = -1, version_at: str = None
+    ) -> List[bytes]:
+        document = Document(manifest=manifest)
+        return document.data_chunks(version_index=version_index, version_at=version_at)
+
+
 class FetchDocumentManifest(CommandHandler):
     """Recupera o manifesto do documento à partir de seu identificador.
 
@@ -193,21 +288,48 @@ class DiffDocumentVersions(CommandHandler):
     ) -> bytes:
         session = self.Session()
         document = session.documents.fetch(id)
-        from_version = document.data(version_at=from_version_at).splitlines()
+        from_version = document.version_at(from_version_at)
         if to_version_at:
-            _to_version_at = {"version_at": to_version_at}
+            to_version = document.version_at(to_version_at)
         else:
-            _to_version_at = {}
-        to_version = document.data(**_to_version_at).splitlines()
-        diff = difflib.diff_bytes(
-            difflib.unified_diff,
-            from_version,
-            to_version,
+            to_version = document.version()
+        return _diff_versions(
+            _version_content_key(from_version),
+            _version_content_key(to_version),
             fromfile=from_version_at.encode("utf-8"),
             tofile=to_version_at.encode("utf-8") if to_version_at else b"latest",
-            lineterm=b"",
         )
-        return b"\n".join(diff)
+
+
+def _version_content_key(version: dict) -> tuple:
+    """Identifica o conteúdo de `version`, determinado pela URL do XML e pelas
+    URIs de seus ativos digitais.
+    """
+    return version["data"], tuple(sorted(version["assets"].items()))
+
+
+@functools.lru_cache(maxsize=64)
+def _diff_versions(from_version: tuple, to_version: tuple, fromfile, tofile) -> bytes:
+    """Produz o *unified diff* entre os conteúdos identificados por
+    `from_version` e `to_version`, conforme `_version_content_key`. Assim como
+    os conteúdos, o resultado é imutável e por isso é mantido em cache.
+    """
+    if from_version == to_version:
+        return b""
+
+    def _lines(version):
+        data_url, assets = version
+        return b"".join(version_data_chunks(data_url, dict(assets))).splitlines()
+
+    diff = difflib.diff_bytes(
+        difflib.unified_diff,
+        _lines(from_version),
+        _lines(to_version),
+        fromfile=fromfile,
+        tofile=tofile,
+        lineterm=b"",
+    )
+    return b"\n".join(diff)
 
 
 class SanitizeDocumentFront(CommandHandler):
@@ -253,8 +375,7 @@ class CreateDocumentsBundle(CommandHandler):
         _bundle = DocumentsBundle(id)
         for doc in docs or []:
             _bundle.add_document(doc)
-        for name, value in (metadata or {}).items():
-            setattr(_bundle, name, value)
+        _apply_metadata(_bundle, metadata or {})
         result = session.documents_bundles.add(_bundle)
         session.notify(
             Events.DOCUMENTSBUNDLE_CREATED,
@@ -273,8 +394,7 @@ class UpdateDocumentsBundleMetadata(CommandHandler):
     def __call__(self, id: str, metadata: dict) -> None:
         session = self.Session()
         _bundle = session.documents_bundles.fetch(id)
-        for name, value in metadata.items():
-            setattr(_bundle, name, value)
+        _apply_metadata(_bundle, metadata)
         session.documents_bundles.update(_bundle)
         session.notify(
             Events.DOCUMENTSBUNDLE_METATADA_UPDATED,
@@ -310,8 +430,7 @@ class CreateJournal(CommandHandler):
     def __call__(self, id: str, metadata: Dict[str, Any] = None) -> None:
         session = self.Session()
         _journal = Journal(id)
-        for name, value in (metadata or {}).items():
-            setattr(_journal, name, value)
+        _apply_metadata(_journal, metadata or {})
         result = session.journals.add(_journal)
         session.notify(
             Events.JOURNAL_CREATED,
@@ -334,8 +453,7 @@ class UpdateJournalMetadata(CommandHandler):
     def __call__(self, id: str, metadata: Dict[str, Any] = None) -> None:
         session = self.Session()
         _journal = session.journals.fetch(id)
-        for name, value in metadata.items():
-            setattr(_journal, name, value)
+        _apply_metadata(_journal, metadata)
         session.journals.update(_journal)
         session.notify(
             Events.JOURNAL_METATADA_UPDATED,
@@ -488,7 +606,9 @@ def get_handlers(
     return {
         "register_document": RegisterDocument(SessionWrapper),
         "register_document_version": RegisterDocumentVersion(SessionWrapper),
+        "upsert_document": UpsertDocument(SessionWrapper),
         "fetch_document_data": FetchDocumentData(SessionWrapper),
+        "render_document_data_chunks": RenderDocumentDataChunks(SessionWrapper),
         "fetch_document_manifest": FetchDocumentManifest(SessionWrapper),
         "fetch_assets_list": FetchAssetsList(SessionWrapper),
         "register_asset_version": RegisterAssetVersion(SessionWrapper),
@@ -21,7 +21,7 @@ setuptools.setup(
         exclude=["*.tests", "*.tests.*", "tests.*", "tests", "docs"]
     ),
     include_package_data=False,
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     install_requires=[
         "lxml",
         "requests",
@@ -39,7 +39,7 @@ setuptools.setup(
         "Environment :: Other Environment",
         "License :: OSI Approved :: BSD License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
+        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3 :: Only",
         "Operating System :: OS Independent",
     ),
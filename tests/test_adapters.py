@@ -1,6 +1,7 @@
 import json
 import unittest
-from unittest.mock import Mock
+from unittest import mock
+from unittest.mock import Mock, MagicMock
 from copy import deepcopy
 
 from documentstore import adapters, domain, exceptions, interfaces
@@ -374,3 +375,30 @@ class MongoDBTests(unittest.TestCase):
         )
         mock_mongoclient.assert_not_called()
 
+    def test_client_is_not_formatted_when_debug_is_disabled(self):
+        client = ReprCountingClientStub()
+        mongodb = adapters.MongoDB("mongodb://db/", mongoclient=lambda uri: client)
+        with mock.patch.object(adapters.LOGGER, "isEnabledFor", return_value=False):
+            mongodb.documents
+            mongodb.documents
+        self.assertEqual(client.reprs, 0)
+
+    def test_client_is_logged_when_debug_is_enabled(self):
+        client = ReprCountingClientStub()
+        mongodb = adapters.MongoDB("mongodb://db/", mongoclient=lambda uri: client)
+        with self.assertLogs(adapters.LOGGER, level="DEBUG") as logs:
+            mongodb.documents
+        self.assertEqual(len(logs.records), 2)
+        self.assertIn("<ReprCountingClientStub>", logs.output[1])
+
+
+class ReprCountingClientStub:
+    def __init__(self):
+        self.reprs = 0
+
+    def __repr__(self):
+        self.reprs += 1
+        return "<ReprCountingClientStub>"
+
+    def __getitem__(self, dbname):
+        return MagicMock()
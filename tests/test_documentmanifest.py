@@ -193,6 +193,26 @@ class TestAddVersion(unittest.TestCase):
             expected,
         )
 
+    def test_manifest_assets_are_immutable(self):
+        doc = {
+            "id": "0034-8910-rsp-48-2-0275",
+            "versions": [
+                {
+                    "data": "/rawfiles/7ca9f9b2687cb/0034-8910-rsp-48-2-0275.xml",
+                    "assets": {"0034-8910-rsp-48-2-0275-gf01.gif": []},
+                }
+            ],
+        }
+        add_asset_version(
+            doc,
+            "0034-8910-rsp-48-2-0275-gf01.gif",
+            "/rawfiles/7a664999a8fb3/0034-8910-rsp-48-2-0275-gf01.gif",
+        )
+
+        self.assertEqual(
+            doc["versions"][-1]["assets"]["0034-8910-rsp-48-2-0275-gf01.gif"], []
+        )
+
     def test_add_asset_version_for_unknown_asset(self):
         doc = {
             "id": "0034-8910-rsp-48-2-0275",
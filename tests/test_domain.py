@@ -3,9 +3,23 @@ from unittest import mock
 import functools
 from copy import deepcopy
 import datetime
+import http.client
+import json
+import os
+import subprocess
+import sys
+from io import BytesIO
+
+from lxml import etree
+import requests
+import urllib3
 
 from documentstore import domain, exceptions
 
+SAMPLE_XML_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "0034-8910-rsp-48-2-0347.xml"
+)
+
 SAMPLE_MANIFEST = {
     "id": "0034-8910-rsp-48-2-0275",
     "versions": [
@@ -45,6 +59,224 @@ def fake_utcnow():
     return "2018-08-05T22:33:49.795151Z"
 
 
+class CloneTests(unittest.TestCase):
+    def test_clone_is_equal_to_original(self):
+        self.assertEqual(domain._clone(SAMPLE_MANIFEST), SAMPLE_MANIFEST)
+
+    def test_clone_doesnt_share_mutable_structures(self):
+        clone = domain._clone(SAMPLE_MANIFEST)
+        self.assertIsNot(clone["versions"], SAMPLE_MANIFEST["versions"])
+        self.assertIsNot(
+            clone["versions"][0]["assets"], SAMPLE_MANIFEST["versions"][0]["assets"]
+        )
+
+
+class GetStaticAssetsTests(unittest.TestCase):
+    def test_assets_are_returned_in_document_order(self):
+        xml = etree.fromstring(
+            b'<article xmlns:xlink="http://www.w3.org/1999/xlink"><body>'
+            b'<media xlink:href="movie.mp4"/>'
+            b'<graphic xlink:href="gf01.jpg"/>'
+            b'<inline-graphic xlink:href="ig01.jpg"/>'
+            b'<supplementary-material xlink:href="sm01.pdf"/>'
+            b'<inline-supplementary-material xlink:href="ism01.pdf"/>'
+            b"</body></article>"
+        ).getroottree()
+        self.assertEqual(
+            [href for href, _ in domain.get_static_assets(xml)],
+            ["movie.mp4", "gf01.jpg", "ig01.jpg", "sm01.pdf", "ism01.pdf"],
+        )
+
+    def test_elements_without_href_are_ignored(self):
+        xml = etree.fromstring(
+            b'<article xmlns:xlink="http://www.w3.org/1999/xlink"><body>'
+            b'<graphic/><ext-link xlink:href="http://www.scielo.br/"/>'
+            b"</body></article>"
+        ).getroottree()
+        self.assertEqual(domain.get_static_assets(xml), [])
+
+
+class GetStaticAssetsHrefsTests(unittest.TestCase):
+    def test_hrefs_are_the_same_as_in_get_static_assets(self):
+        with open(SAMPLE_XML_PATH, "rb") as f:
+            expected = [href for href, _ in domain.get_static_assets(etree.parse(f))]
+        with open(SAMPLE_XML_PATH, "rb") as f:
+            self.assertEqual(domain.get_static_assets_hrefs(f), expected)
+        self.assertEqual(len(expected), 8)
+
+
+class DocumentDataTests(unittest.TestCase):
+    def setUp(self):
+        domain._remote_xml_template.cache_clear()
+        with open(SAMPLE_XML_PATH, "rb") as f:
+            sample = f.read()
+        patcher = mock.patch.object(
+            domain, "fetch_stream", side_effect=lambda url, timeout: BytesIO(sample)
+        )
+        self.fetch_stream = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.document = domain.Document(id="0034-8910-rsp-48-2-0347")
+        self.document.new_version("/rawfiles/0034-8910-rsp-48-2-0347.xml")
+        self.document.new_asset_version(
+            "0034-8910-rsp-48-2-0347-gf01", '/rawfiles/gf01.jpg?a=1&b="2"'
+        )
+        self.fetch_stream.reset_mock()
+
+    def test_data_is_the_same_as_produced_by_assets_getter(self):
+        self.assertEqual(
+            self.document.data(),
+            self.document.data(assets_getter=domain.assets_from_remote_xml),
+        )
+
+    def test_assets_without_uri_keep_the_original_href(self):
+        data = self.document.data()
+        self.assertIn(b'xlink:href="/rawfiles/gf01.jpg?a=1&amp;b=&quot;2&quot;"', data)
+        self.assertIn(b'xlink:href="0034-8910-rsp-48-2-0347-gf02"', data)
+
+    def test_data_chunks_compose_the_data(self):
+        self.assertEqual(b"".join(self.document.data_chunks()), self.document.data())
+
+    def test_data_chunks_share_the_cached_xml_fragments(self):
+        first = self.document.data_chunks()
+        second = self.document.data_chunks()
+        self.assertIs(first[0], second[0])
+        self.assertIs(first[-1], second[-1])
+
+    def test_data_chunks_raise_eagerly_for_unknown_versions(self):
+        self.assertRaises(
+            ValueError, self.document.data_chunks, version_at="1900-01-01"
+        )
+
+    def test_remote_xml_is_fetched_only_once(self):
+        self.document.data()
+        self.document.data()
+        self.fetch_stream.assert_called_once_with(
+            "/rawfiles/0034-8910-rsp-48-2-0347.xml", 2
+        )
+
+
+class DeepcopyTests(unittest.TestCase):
+    def assert_independent_copy(self, entity):
+        copied = deepcopy(entity)
+        self.assertIsInstance(copied, type(entity))
+        self.assertEqual(copied.manifest, entity.manifest)
+        self.assertIsNot(copied.manifest, entity.manifest)
+        return copied
+
+    def test_document(self):
+        document = domain.Document(manifest=deepcopy(SAMPLE_MANIFEST))
+        document.version()
+        copied = self.assert_independent_copy(document)
+        copied.new_asset_version(
+            "0034-8910-rsp-48-2-0275-gf01.gif", "/rawfiles/1f7f5c1a7ff0a/gf01.gif"
+        )
+        self.assertEqual(
+            document.version()["assets"]["0034-8910-rsp-48-2-0275-gf01.gif"],
+            "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-gf01.gif",
+        )
+
+    def test_documents_bundle(self):
+        documents_bundle = domain.DocumentsBundle(id="0034-8910-rsp-48-2")
+        documents_bundle.titles = {"en": "Title"}
+        documents_bundle.add_document("/documents/0034-8910-rsp-48-2-0275")
+        self.assert_independent_copy(documents_bundle)
+
+    def test_journal(self):
+        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        journal.subject_areas = ["HEALTH SCIENCES"]
+        copied = self.assert_independent_copy(journal)
+        self.assertEqual(copied.subject_areas, ("HEALTH SCIENCES",))
+
+    def test_shared_references_are_preserved(self):
+        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        copied = deepcopy([journal, journal])
+        self.assertIs(copied[0], copied[1])
+
+
+class LazyImportsTests(unittest.TestCase):
+    def test_module_import_does_not_load_requests_nor_lxml(self):
+        code = (
+            "import sys; import documentstore.domain; "
+            "print(sorted(m for m in ('lxml', 'requests') if m in sys.modules))"
+        )
+        output = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual(output.strip(), b"[]")
+
+    def test_remote_xml_is_not_parsed_with_a_shared_parser(self):
+        parsers = []
+        real_parse = etree.parse
+
+        def parse(source, parser):
+            parsers.append(parser)
+            return real_parse(source, parser)
+
+        with mock.patch.object(
+            domain, "fetch_stream", side_effect=lambda url, timeout: BytesIO(b"<a/>")
+        ), mock.patch("lxml.etree.parse", side_effect=parse):
+            domain.assets_from_remote_xml("http://a.br/a.xml")
+            domain.assets_from_remote_xml("http://a.br/a.xml")
+        self.assertEqual(len(parsers), 2)
+        self.assertIsNot(parsers[0], parsers[1])
+        self.assertIsNot(parsers[0], domain.DEFAULT_XMLPARSER)
+
+    def test_default_xmlparser_is_still_available(self):
+        self.assertIs(domain.DEFAULT_XMLPARSER, domain.DEFAULT_XMLPARSER)
+        self.assertIsInstance(domain.DEFAULT_XMLPARSER, etree.XMLParser)
+
+    def test_unknown_attributes_raise_attribute_error(self):
+        self.assertRaises(AttributeError, getattr, domain, "UNKNOWN")
+
+
+class FetchStreamTests(unittest.TestCase):
+    @mock.patch.object(domain._http_session(), "get")
+    def test_read_errors_are_retryable(self, mocked_get):
+        mocked_get.return_value.raw.read.side_effect = urllib3.exceptions.ProtocolError(
+            "connection broken"
+        )
+        with self.assertRaises(exceptions.RetryableError):
+            with domain.fetch_stream("http://www.scielo.br/a.xml") as stream:
+                stream.read()
+
+    @mock.patch.object(domain._http_session(), "get")
+    def test_response_is_closed(self, mocked_get):
+        with domain.fetch_stream("http://www.scielo.br/a.xml"):
+            pass
+        mocked_get.return_value.close.assert_called_once_with()
+
+
+class HTTPSessionTests(unittest.TestCase):
+    def test_cookies_are_not_kept(self):
+        session = domain._new_http_session()
+        headers = http.client.HTTPMessage()
+        headers["Set-Cookie"] = "session=abc; Path=/"
+        response = mock.Mock()
+        response._original_response.msg = headers
+        request = requests.Request("GET", "http://www.scielo.br/a.xml").prepare()
+        requests.cookies.extract_cookies_to_jar(session.cookies, request, response)
+        self.assertEqual(len(session.cookies), 0)
+
+
+class FetchDataManyTests(unittest.TestCase):
+    @mock.patch.object(domain, "fetch_data")
+    def test_maps_urls_to_their_data(self, mocked_fetch_data):
+        mocked_fetch_data.side_effect = lambda url, timeout: url.encode("utf-8")
+        self.assertEqual(
+            domain.fetch_data_many(["http://a.br/1.jpg", "http://a.br/2.jpg"]),
+            {
+                "http://a.br/1.jpg": b"http://a.br/1.jpg",
+                "http://a.br/2.jpg": b"http://a.br/2.jpg",
+            },
+        )
+
+    @mock.patch.object(domain, "fetch_data")
+    def test_errors_are_propagated(self, mocked_fetch_data):
+        mocked_fetch_data.side_effect = exceptions.NonRetryableError()
+        self.assertRaises(
+            exceptions.NonRetryableError, domain.fetch_data_many, ["http://a.br/1.jpg"]
+        )
+
+
 class UnittestMixin:
     def _assert_raises_with_message(self, type, message, func, *args):
         try:
@@ -126,6 +358,26 @@ class DocumentTests(unittest.TestCase):
         }
         self.assertEqual(oldest, expected)
 
+    def test_version_reflects_new_asset_version(self):
+        document = self.make_one()
+        document.version()
+        document.new_asset_version(
+            "0034-8910-rsp-48-2-0275-gf01.gif",
+            "/rawfiles/cc3a8b9ba7166/0034-8910-rsp-48-2-0275-gf01.gif",
+        )
+        self.assertEqual(
+            document.version()["assets"]["0034-8910-rsp-48-2-0275-gf01.gif"],
+            "/rawfiles/cc3a8b9ba7166/0034-8910-rsp-48-2-0275-gf01.gif",
+        )
+
+    def test_changes_to_version_assets_are_not_persisted(self):
+        document = self.make_one()
+        document.version()["assets"]["0034-8910-rsp-48-2-0275-gf01.gif"] = ""
+        self.assertEqual(
+            document.version()["assets"]["0034-8910-rsp-48-2-0275-gf01.gif"],
+            "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-gf01.gif",
+        )
+
     def test_new_version_automaticaly_references_latest_known_assets(self):
         manifest = {
             "id": "0034-8910-rsp-48-2-0275",
@@ -162,6 +414,24 @@ class DocumentTests(unittest.TestCase):
             "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-gf01.gif",
         )
 
+    def test_new_version_does_not_build_the_latest_version(self):
+        document = self.make_one()
+        with mock.patch.object(domain.Document, "version") as mock_version:
+            document.new_version(
+                "/rawfiles/5e0b3f5d1ac7a/0034-8910-rsp-48-2-0275.xml",
+                assets_getter=lambda data_url, timeout: (
+                    None,
+                    [("0034-8910-rsp-48-2-0275-gf01.gif", None)],
+                ),
+            )
+        mock_version.assert_not_called()
+        self.assertEqual(
+            document.version()["assets"],
+            {
+                "0034-8910-rsp-48-2-0275-gf01.gif": "/rawfiles/bf139b9aa3066/0034-8910-rsp-48-2-0275-gf01.gif"
+            },
+        )
+
     def test_version_at_later_time(self):
         """
         No manifesto `SAMPLE_MANIFEST`, a versão mais recente possui foi
@@ -201,6 +471,15 @@ class DocumentTests(unittest.TestCase):
         }
         self.assertEqual(target, expected)
 
+    def test_version_at_given_time_with_json_decoded_manifest(self):
+        manifest = json.loads(json.dumps(SAMPLE_MANIFEST))
+        document = domain.Document(manifest=manifest)
+        target = document.version_at("2018-08-05T23:04:00Z")
+        self.assertEqual(
+            target["assets"]["0034-8910-rsp-48-2-0275-gf01.gif"],
+            "/rawfiles/8e644999a8fa4/0034-8910-rsp-48-2-0275-gf01.gif",
+        )
+
     def test_version_at_time_prior_to_data_registration(self):
         document = self.make_one()
         self.assertRaises(ValueError, lambda: document.version_at("2018-07-01"))
@@ -521,6 +800,52 @@ class BundleManifestTest(UnittestMixin, unittest.TestCase):
         self.assertEqual(current_updated, documents_bundle["updated"])
         self.assertEqual(current_item_len, len(documents_bundle["items"]))
 
+    def test_set_metadata_doesnt_modify_the_original_bundle(self):
+        documents_bundle = new_bundle("0034-8910-rsp-48-2")
+        domain.BundleManifest.set_metadata(
+            documents_bundle, "publication_year", "2018", now=fake_utcnow
+        )
+        self.assertEqual(documents_bundle["metadata"], {})
+
+    def test_add_item_doesnt_modify_the_original_bundle(self):
+        documents_bundle = new_bundle("0034-8910-rsp-48-2")
+        domain.BundleManifest.add_item(
+            documents_bundle, "/documents/0034-8910-rsp-48-2-0275"
+        )
+        self.assertEqual(documents_bundle["items"], [])
+
+    def test_update_metadata(self):
+        documents_bundle = new_bundle("0034-8910-rsp-48-2")
+        documents_bundle = domain.BundleManifest.set_metadata(
+            documents_bundle,
+            "volume",
+            "1",
+            now=lambda: "2018-08-05T22:33:49.795151Z",
+        )
+        documents_bundle = domain.BundleManifest.update_metadata(
+            documents_bundle,
+            {"volume": "2", "number": "3"},
+            now=lambda: "2018-08-05T22:34:07.795151Z",
+        )
+        self.assertEqual(
+            documents_bundle["metadata"],
+            {
+                "volume": [
+                    ("2018-08-05T22:33:49.795151Z", "1"),
+                    ("2018-08-05T22:34:07.795151Z", "2"),
+                ],
+                "number": [("2018-08-05T22:34:07.795151Z", "3")],
+            },
+        )
+        self.assertEqual(documents_bundle["updated"], "2018-08-05T22:34:07.795151Z")
+
+    def test_update_metadata_doesnt_modify_the_original_bundle(self):
+        documents_bundle = new_bundle("0034-8910-rsp-48-2")
+        domain.BundleManifest.update_metadata(
+            documents_bundle, {"volume": "2", "number": "3"}, now=fake_utcnow
+        )
+        self.assertEqual(documents_bundle["metadata"], {})
+
 
 class DocumentsBundleTest(UnittestMixin, unittest.TestCase):
     def setUp(self):
@@ -772,6 +1097,33 @@ class DocumentsBundleTest(UnittestMixin, unittest.TestCase):
             {"en": "Title", "pt": "Título", "es": "Título"},
         )
 
+    def test_data_does_not_change_the_manifest(self):
+        documents_bundle = domain.DocumentsBundle(id="0034-8910-rsp-48-2")
+        documents_bundle.titles = {"en": "Title", "pt": "Título"}
+        documents_bundle.add_document("/documents/0034-8910-rsp-48-2-0275")
+        data = documents_bundle.data()
+        data["items"].append("/documents/0034-8910-rsp-48-2-0276")
+        self.assertEqual(
+            documents_bundle.manifest["items"], ["/documents/0034-8910-rsp-48-2-0275"]
+        )
+        self.assertEqual(len(documents_bundle.manifest["metadata"]["titles"]), 1)
+
+    def test_update_metadata(self):
+        documents_bundle = domain.DocumentsBundle(id="0034-8910-rsp-48-2")
+        documents_bundle.update_metadata({"publication_year": 2018, "volume": 2})
+        self.assertEqual(documents_bundle.publication_year, "2018")
+        self.assertEqual(documents_bundle.volume, "2")
+
+    def test_update_metadata_with_invalid_publication_year(self):
+        documents_bundle = domain.DocumentsBundle(id="0034-8910-rsp-48-2")
+        self._assert_raises_with_message(
+            ValueError,
+            "cannot set publication_year with value " '"18": the value is not valid',
+            documents_bundle.update_metadata,
+            {"volume": "2", "publication_year": "18"},
+        )
+        self.assertEqual(documents_bundle.manifest["metadata"], {})
+
 
 class JournalTest(UnittestMixin, unittest.TestCase):
     def setUp(self):
@@ -1082,6 +1434,61 @@ class JournalTest(UnittestMixin, unittest.TestCase):
             subject_areas,
         )
 
+    def test_set_subject_areas_with_unhashable_item_raises_value_error(self):
+        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        subject_areas = ("HEALTH SCIENCES", {"area": "HUMAN SCIENCES"})
+        self._assert_raises_with_message(
+            ValueError,
+            "cannot set subject_areas with value %s: " % repr(subject_areas)
+            + "%s are not valid" % repr([{"area": "HUMAN SCIENCES"}]),
+            setattr,
+            journal,
+            "subject_areas",
+            subject_areas,
+        )
+
+    def test_update_metadata(self):
+        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        journal.update_metadata(
+            {
+                "title": "Ciência Rural",
+                "subject_areas": ["AGRICULTURAL SCIENCES"],
+                "contact": {"email": "cienciarural@mail.ufsm.br"},
+            }
+        )
+        self.assertEqual(journal.title, "Ciência Rural")
+        self.assertEqual(journal.subject_areas, ("AGRICULTURAL SCIENCES",))
+        self.assertEqual(journal.contact, {"email": "cienciarural@mail.ufsm.br"})
+        self.assertEqual(journal.updated(), "2018-08-05T22:33:49.795151Z")
+
+    def test_update_metadata_builds_a_single_manifest(self):
+        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        with mock.patch.object(
+            domain.BundleManifest, "set_metadata"
+        ) as mock_set_metadata:
+            journal.update_metadata({"title": "Ciência Rural", "acronym": "cr"})
+        mock_set_metadata.assert_not_called()
+        self.assertEqual(journal.acronym, "cr")
+
+    def test_update_metadata_validates_every_value_before_writing(self):
+        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        self.assertRaises(
+            ValueError,
+            journal.update_metadata,
+            {"title": "Ciência Rural", "subject_areas": ["INVALID"]},
+        )
+        self.assertEqual(journal.manifest["metadata"], {})
+
+    def test_update_metadata_sets_other_properties(self):
+        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        journal.update_metadata({"title": "Ciência Rural", "provisional": "xpto"})
+        self.assertEqual(journal.title, "Ciência Rural")
+        self.assertEqual(journal.provisional, "xpto")
+
+    def test_update_metadata_with_unknown_name_raises_attribute_error(self):
+        journal = domain.Journal(id="0034-8910-rsp-48-2")
+        self.assertRaises(AttributeError, journal.update_metadata, {"unknown": "0"})
+
     def test_set_sponsors(self):
         journal = domain.Journal(id="0034-8910-rsp-48-2")
         journal.sponsors = (
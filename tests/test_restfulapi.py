@@ -1,16 +1,27 @@
 import os
+import json
+import threading
 import unittest
+from io import BytesIO
 from copy import deepcopy
+from unittest import mock
 from unittest.mock import patch, Mock
 
 import colander
 from pyramid import testing
+from pyramid.interfaces import IRequestExtensions
+from pyramid.renderers import render_to_response
+from pyramid.request import Request, apply_request_extensions
+from cornice.errors import Errors
+from cornice.service import get_services
+from cornice.validators import colander_body_validator
 from pyramid.httpexceptions import (
     HTTPOk,
     HTTPNotFound,
     HTTPCreated,
     HTTPNoContent,
     HTTPBadRequest,
+    HTTPTooManyRequests,
 )
 
 from documentstore import services, restfulapi, exceptions
@@ -28,12 +39,12 @@ def make_request():
     return request
 
 
-def fetch_data_stub(url, timeout=2):
+def fetch_stream_stub(url, timeout=2):
     assert url.endswith("0034-8910-rsp-48-2-0347.xml")
-    return SAMPLE_DOCUMENT_DATA
+    return BytesIO(SAMPLE_DOCUMENT_DATA)
 
 
-@patch("documentstore.domain.fetch_data", new=fetch_data_stub)
+@patch("documentstore.domain.fetch_stream", new=fetch_stream_stub)
 class FetchDocumentDataUnitTests(unittest.TestCase):
     def test_when_doesnt_exist_returns_http_404(self):
         request = make_request()
@@ -50,7 +61,8 @@ class FetchDocumentDataUnitTests(unittest.TestCase):
         )
 
         document_data = restfulapi.fetch_document_data(request)
-        self.assertIsInstance(document_data, bytes)
+        self.assertIsInstance(document_data, list)
+        self.assertIsInstance(b"".join(document_data), bytes)
 
     def test_versions_prior_to_creation_returns_http_404(self):
         request = make_request()
@@ -74,10 +86,247 @@ class FetchDocumentDataUnitTests(unittest.TestCase):
         )
 
         document_data = restfulapi.fetch_document_data(request)
-        self.assertIsInstance(document_data, bytes)
+        self.assertIsInstance(document_data, list)
+        self.assertIsInstance(b"".join(document_data), bytes)
 
 
-@patch("documentstore.domain.fetch_data", new=fetch_data_stub)
+class HTTPCacheUnitTests(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("documentstore.domain.fetch_stream", new=fetch_stream_stub)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(restfulapi._IMMUTABLE_DOCUMENT_DATA.clear)
+        self.request = make_request()
+        self.request.matchdict = {"document_id": "my-testing-doc"}
+        self.request.services["register_document"](
+            id="my-testing-doc",
+            data_url="https://raw.githubusercontent.com/scieloorg/packtools/master/tests/samples/0034-8910-rsp-48-2-0347.xml",
+            assets={"0034-8910-rsp-48-2-0347-gf01": "http://a.br/gf01.jpg"},
+        )
+
+    def new_request(self, headers=None, GET=None):
+        request = testing.DummyRequest(headers=headers or {}, params=GET or {})
+        request.services = self.request.services
+        request.matchdict = self.request.matchdict
+        return request
+
+    def test_document_data_sets_cache_headers(self):
+        restfulapi.fetch_document_data(self.request)
+        response = self.request.response
+        self.assertIsNotNone(response.etag)
+        self.assertIsNotNone(response.last_modified)
+        self.assertEqual(
+            response.headers["Cache-Control"], restfulapi.CACHE_CONTROL_DEFAULT
+        )
+
+    def test_document_data_at_past_instant_is_immutable(self):
+        request = self.new_request(GET={"when": "2100-01-01"})
+        with patch.object(restfulapi, "utcnow", return_value="2200-01-01T00:00:00Z"):
+            restfulapi.fetch_document_data(request)
+        self.assertEqual(
+            request.response.headers["Cache-Control"],
+            restfulapi.CACHE_CONTROL_IMMUTABLE,
+        )
+
+    def test_document_data_at_past_instant_is_kept_in_memory(self):
+        request = self.new_request(GET={"when": "2100-01-01"})
+        with patch.object(restfulapi, "utcnow", return_value="2200-01-01T00:00:00Z"):
+            data = restfulapi.fetch_document_data(request)
+            request = self.new_request(GET={"when": "2100-01-01"})
+            request.services = {}
+            self.assertIs(restfulapi.fetch_document_data(request), data)
+        self.assertEqual(
+            request.response.headers["Cache-Control"],
+            restfulapi.CACHE_CONTROL_IMMUTABLE,
+        )
+
+    def test_document_data_kept_in_memory_honors_etag(self):
+        request = self.new_request(GET={"when": "2100-01-01"})
+        with patch.object(restfulapi, "utcnow", return_value="2200-01-01T00:00:00Z"):
+            restfulapi.fetch_document_data(request)
+            request = self.new_request(
+                headers={"If-None-Match": '"%s"' % request.response.etag},
+                GET={"when": "2100-01-01"},
+            )
+            request.services = {}
+            response = restfulapi.fetch_document_data(request)
+        self.assertEqual(response.status_code, 304)
+
+    def test_document_data_at_current_date_is_not_kept_in_memory(self):
+        today = restfulapi.utcnow()[:10]
+        data = restfulapi.fetch_document_data(self.new_request(GET={"when": today}))
+        self.assertIn(b'xlink:href="http://a.br/gf01.jpg"', b"".join(data))
+        self.request.services["register_asset_version"](
+            id="my-testing-doc",
+            asset_id="0034-8910-rsp-48-2-0347-gf01",
+            asset_url="http://a.br/gf01-v2.jpg",
+        )
+        data = restfulapi.fetch_document_data(self.new_request(GET={"when": today}))
+        self.assertIn(b'xlink:href="http://a.br/gf01-v2.jpg"', b"".join(data))
+
+    def test_pinned_document_data_etag_ignores_newer_versions(self):
+        request = self.new_request(GET={"when": "2100-01-01"})
+        restfulapi.fetch_document_data(request)
+        etag = request.response.etag
+
+        manifest = self.request.services["fetch_document_manifest"](id="my-testing-doc")
+        version = manifest["versions"][-1]
+        gf01 = version["assets"]["0034-8910-rsp-48-2-0347-gf01"]
+        newer_manifest = dict(
+            manifest,
+            versions=manifest["versions"][:-1]
+            + [
+                dict(
+                    version,
+                    assets=dict(
+                        version["assets"],
+                        **{
+                            "0034-8910-rsp-48-2-0347-gf01": gf01
+                            + [["2100-01-02T00:00:00Z", "http://a.br/gf01-v2.jpg"]]
+                        },
+                    ),
+                )
+            ],
+        )
+        request = self.new_request(GET={"when": "2100-01-01"})
+        request.services = dict(
+            request.services, fetch_document_manifest=Mock(return_value=newer_manifest)
+        )
+        restfulapi.fetch_document_data(request)
+        self.assertEqual(request.response.etag, etag)
+
+    def test_document_data_at_future_instant_is_not_kept_in_memory(self):
+        restfulapi.fetch_document_data(self.new_request(GET={"when": "2100-01-01"}))
+        request = self.new_request(GET={"when": "2100-01-01"})
+        request.services = dict(request.services, render_document_data_chunks=Mock())
+        restfulapi.fetch_document_data(request)
+        request.services["render_document_data_chunks"].assert_called_once()
+
+    def test_document_data_reads_the_document_once(self):
+        store = self.request.services["fetch_document_manifest"].Session().documents
+        with patch.object(store, "fetch", wraps=store.fetch) as mock_fetch:
+            data = restfulapi.fetch_document_data(self.request)
+        mock_fetch.assert_called_once_with("my-testing-doc")
+        self.assertIn(b'xlink:href="http://a.br/gf01.jpg"', b"".join(data))
+
+    def test_document_data_at_current_date_is_not_immutable(self):
+        today = restfulapi.utcnow()[:10]
+        request = self.new_request(GET={"when": today})
+        restfulapi.fetch_document_data(request)
+        self.assertEqual(
+            request.response.headers["Cache-Control"], restfulapi.CACHE_CONTROL_DEFAULT
+        )
+
+    def test_date_is_immutable_only_after_its_end(self):
+        for now, expected in [
+            ("2018-01-01T23:59:59.500000Z", False),
+            ("2018-01-02T00:00:00.000001Z", True),
+        ]:
+            with self.subTest(now=now):
+                with patch.object(restfulapi, "utcnow", return_value=now):
+                    self.assertEqual(restfulapi._is_immutable("2018-01-01"), expected)
+
+    def test_document_data_at_future_instant_is_not_immutable(self):
+        request = self.new_request(GET={"when": "2100-01-01"})
+        restfulapi.fetch_document_data(request)
+        self.assertEqual(
+            request.response.headers["Cache-Control"], restfulapi.CACHE_CONTROL_DEFAULT
+        )
+
+    def test_document_data_with_matching_etag_returns_304(self):
+        restfulapi.fetch_document_data(self.request)
+        request = self.new_request(
+            headers={"If-None-Match": '"%s"' % self.request.response.etag}
+        )
+        request.services = dict(request.services, render_document_data_chunks=Mock())
+        response = restfulapi.fetch_document_data(request)
+        self.assertEqual(response.status_code, 304)
+        request.services["render_document_data_chunks"].assert_not_called()
+
+    def test_not_modified_response_keeps_cache_headers(self):
+        restfulapi.fetch_document_data(self.request)
+        request = self.new_request(
+            headers={"If-None-Match": '"%s"' % self.request.response.etag}
+        )
+        response = restfulapi.fetch_document_data(request)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.etag, self.request.response.etag)
+        self.assertEqual(
+            response.headers["Cache-Control"], restfulapi.CACHE_CONTROL_DEFAULT
+        )
+        self.assertEqual(
+            response.headers["Last-Modified"],
+            self.request.response.headers["Last-Modified"],
+        )
+
+    def test_not_modified_response_has_no_representation_metadata(self):
+        restfulapi.get_manifest(self.request)
+        request = self.new_request(
+            headers={"If-None-Match": '"%s"' % self.request.response.etag}
+        )
+        response = Request.blank("/").get_response(restfulapi.get_manifest(request))
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.body, b"")
+        self.assertNotIn("Content-Type", response.headers)
+        self.assertNotIn("Content-Length", response.headers)
+
+    def test_document_data_with_matching_weak_etag_returns_304(self):
+        restfulapi.fetch_document_data(self.request)
+        request = self.new_request(
+            headers={"If-None-Match": 'W/"%s"' % self.request.response.etag}
+        )
+        response = restfulapi.fetch_document_data(request)
+        self.assertEqual(response.status_code, 304)
+
+    def test_document_data_etag_changes_with_new_asset_version(self):
+        restfulapi.fetch_document_data(self.request)
+        request = self.new_request(
+            headers={"If-None-Match": '"%s"' % self.request.response.etag}
+        )
+        request.services["register_asset_version"](
+            id="my-testing-doc",
+            asset_id="0034-8910-rsp-48-2-0347-gf01",
+            asset_url="http://a.br/gf01-v2.jpg",
+        )
+        self.assertIsInstance(restfulapi.fetch_document_data(request), list)
+
+    def test_document_data_with_if_modified_since_returns_304(self):
+        restfulapi.fetch_document_data(self.request)
+        request = self.new_request(
+            headers={
+                "If-Modified-Since": self.request.response.headers["Last-Modified"]
+            }
+        )
+        response = restfulapi.fetch_document_data(request)
+        self.assertEqual(response.status_code, 304)
+
+    def test_manifest_with_matching_etag_returns_304(self):
+        restfulapi.get_manifest(self.request)
+        request = self.new_request(
+            headers={"If-None-Match": '"%s"' % self.request.response.etag}
+        )
+        response = restfulapi.get_manifest(request)
+        self.assertEqual(response.status_code, 304)
+
+    def test_assets_list_etag_changes_with_new_asset_version(self):
+        restfulapi.get_assets_list(self.request)
+        request = self.new_request(
+            headers={"If-None-Match": '"%s"' % self.request.response.etag}
+        )
+        self.assertEqual(restfulapi.get_assets_list(request).status_code, 304)
+
+        request.services["register_asset_version"](
+            id="my-testing-doc",
+            asset_id="0034-8910-rsp-48-2-0347-gf01",
+            asset_url="http://a.br/gf01-v2.jpg",
+        )
+        request = self.new_request(
+            headers={"If-None-Match": '"%s"' % self.request.response.etag}
+        )
+        self.assertIsInstance(restfulapi.get_assets_list(request), dict)
+
+
+@patch("documentstore.domain.fetch_stream", new=fetch_stream_stub)
 class PutDocumentUnitTests(unittest.TestCase):
     def test_registration_of_new_document_returns_201(self):
         request = make_request()
@@ -103,6 +352,317 @@ class PutDocumentUnitTests(unittest.TestCase):
         self.assertIsInstance(restfulapi.put_document(request), HTTPNoContent)
 
 
+@patch("documentstore.domain.fetch_stream", new=fetch_stream_stub)
+class PutAssetUnitTests(unittest.TestCase):
+    def make_request(self, asset_slug):
+        request = make_request()
+        request.matchdict = {
+            "document_id": "0034-8910-rsp-48-2-0347",
+            "asset_slug": asset_slug,
+        }
+        request.validated = {"asset_url": "http://a.br/gf01-v2.jpg"}
+        request.services["register_document"](
+            id="0034-8910-rsp-48-2-0347",
+            data_url="https://raw.githubusercontent.com/scieloorg/packtools/master/tests/samples/0034-8910-rsp-48-2-0347.xml",
+            assets={"0034-8910-rsp-48-2-0347-gf01": "http://a.br/gf01.jpg"},
+        )
+        return request
+
+    def test_registers_the_asset_version(self):
+        request = self.make_request("0034-8910-rsp-48-2-0347-gf01")
+        self.assertIsInstance(restfulapi.put_asset(request), HTTPNoContent)
+        assets = request.services["fetch_assets_list"](id="0034-8910-rsp-48-2-0347")
+        self.assertEqual(
+            assets["assets"]["0034-8910-rsp-48-2-0347-gf01"],
+            "http://a.br/gf01-v2.jpg",
+        )
+
+    def test_unknown_slug_returns_404(self):
+        request = self.make_request("unknown")
+        self.assertRaises(HTTPNotFound, restfulapi.put_asset, request)
+
+    def test_asset_id_by_slug_stops_at_the_first_match(self):
+        slug_fn = Mock(side_effect=lambda asset_id: asset_id.lower())
+        asset_id = restfulapi._asset_id_by_slug(
+            {"A": "", "B": "", "C": ""}, "c", slug_fn=slug_fn
+        )
+        self.assertEqual(asset_id, "C")
+        slug_fn.assert_called_once_with("C")
+
+
+class SlugifyAssetsIdsUnitTests(unittest.TestCase):
+    def test_slugs_are_the_same_as_produced_by_slugify(self):
+        assets = {"0034-8910-rsp-48-2-0347-GF01.jpg": "http://a.br/gf01.jpg"}
+        self.assertEqual(
+            restfulapi.slugify_assets_ids(assets),
+            [
+                {
+                    "slug": restfulapi.slugify("0034-8910-rsp-48-2-0347-GF01.jpg"),
+                    "id": "0034-8910-rsp-48-2-0347-GF01.jpg",
+                    "url": "http://a.br/gf01.jpg",
+                }
+            ],
+        )
+
+    def test_slugs_are_memoized(self):
+        restfulapi._slugify_asset_id.cache_clear()
+        with patch.object(restfulapi, "slugify", return_value="gf01") as mock_slugify:
+            restfulapi.slugify_assets_ids({"gf01": ""})
+            restfulapi.slugify_assets_ids({"gf01": ""})
+        restfulapi._slugify_asset_id.cache_clear()
+        mock_slugify.assert_called_once_with("gf01")
+
+    def test_slugified_assets_lists_are_memoized_by_content(self):
+        assets = {"gf01.jpg": "http://a.br/gf01.jpg", "gf02.jpg": ""}
+        first = restfulapi._slugify_assets_items(tuple(assets.items()))
+        second = restfulapi._slugify_assets_items(tuple(dict(assets).items()))
+        self.assertEqual(first, restfulapi.slugify_assets_ids(assets))
+        self.assertIs(first, second)
+
+
+class IsURLUnitTests(unittest.TestCase):
+    def test_accepts_what_colander_accepts(self):
+        for value in ["http://a.br/a.jpg", "https://a.br", "a.jpg", "", "http://"]:
+            with self.subTest(value=value):
+                try:
+                    colander.url(None, value)
+                except colander.Invalid:
+                    expected = False
+                else:
+                    expected = True
+                self.assertEqual(restfulapi._is_url(value), expected)
+
+    def test_non_strings_are_not_urls(self):
+        for value in [None, 1, ["http://a.br"], {"url": "http://a.br"}]:
+            with self.subTest(value=value):
+                self.assertFalse(restfulapi._is_url(value))
+
+
+class DiffDocumentVersionsUnitTests(unittest.TestCase):
+    def make_request(self, slots=1):
+        request = make_request()
+        request.matchdict = {"document_id": "my-testing-doc"}
+        request.GET = {"from_when": "2018-01-01"}
+        request.services = {"diff_document_versions": Mock(return_value=b"")}
+        request.diff_slots = threading.BoundedSemaphore(slots)
+        return request
+
+    def test_diff_is_returned(self):
+        request = self.make_request()
+        self.assertEqual(restfulapi.diff_document_versions(request), b"")
+
+    def test_slot_is_released(self):
+        request = self.make_request()
+        request.services["diff_document_versions"].side_effect = ValueError()
+        self.assertRaises(HTTPNotFound, restfulapi.diff_document_versions, request)
+        self.assertTrue(request.diff_slots.acquire(blocking=False))
+
+    def test_too_many_concurrent_diffs_returns_429(self):
+        request = self.make_request()
+        request.diff_slots.acquire()
+        with self.assertRaises(HTTPTooManyRequests) as ctx:
+            restfulapi.diff_document_versions(request)
+        self.assertEqual(ctx.exception.headers["Retry-After"], "1")
+        request.services["diff_document_versions"].assert_not_called()
+
+
+class FastBodyValidatorUnitTests(unittest.TestCase):
+    def make_request(self, body, content_type="application/json"):
+        request = testing.DummyRequest()
+        request.content_type = content_type
+        request.body = json.dumps(body).encode("utf-8")
+        request.json_body = body
+        request.errors = Errors()
+        request.validated = {}
+        return request
+
+    def assert_same_as_colander(self, validate, schema, body):
+        expected = self.make_request(body)
+        colander_body_validator(expected, schema=schema)
+        request = self.make_request(body)
+        restfulapi.fast_body_validator(validate)(request, schema=schema)
+        self.assertEqual(request.validated, expected.validated)
+        self.assertEqual(request.errors, expected.errors)
+
+    def test_register_document(self):
+        bodies = [
+            apptesting.document_registry_data_fixture(),
+            {"data": "http://a.br/x.xml", "assets": [], "unknown": 1},
+            {
+                "data": "http://a.br/x.xml",
+                "assets": [{"asset_id": "a", "asset_url": "http://a.br/a", "x": 1}],
+            },
+            {"data": "not-a-url", "assets": []},
+            {"data": "http://a.br/x.xml"},
+            {"data": "http://a.br/x.xml", "assets": [{"asset_id": 1}]},
+            {
+                "data": "http://a.br/x.xml",
+                "assets": [{"asset_id": "", "asset_url": ""}],
+            },
+            {"data": "http://a.br/x.xml", "assets": ["a"]},
+            [],
+            {},
+        ]
+        for body in bodies:
+            with self.subTest(body=body):
+                self.assert_same_as_colander(
+                    restfulapi._validate_register_document,
+                    restfulapi.RegisterDocumentSchema(),
+                    body,
+                )
+
+    def test_asset(self):
+        bodies = [
+            {"asset_url": "http://a.br/a.jpg"},
+            {"asset_url": "http://a.br/a.jpg", "unknown": 1},
+            {"asset_url": "a.jpg"},
+            {"asset_url": 1},
+            {},
+        ]
+        for body in bodies:
+            with self.subTest(body=body):
+                self.assert_same_as_colander(
+                    restfulapi._validate_asset, restfulapi.AssetSchema(), body
+                )
+
+    def test_valid_bodies_skip_colander(self):
+        request = self.make_request({"asset_url": "http://a.br/a.jpg"})
+        with patch.object(restfulapi, "colander_body_validator") as mock_colander:
+            restfulapi.fast_body_validator(restfulapi._validate_asset)(
+                request, schema=restfulapi.AssetSchema()
+            )
+        mock_colander.assert_not_called()
+        self.assertEqual(request.validated, {"asset_url": "http://a.br/a.jpg"})
+
+    def test_other_content_types_are_validated_by_colander(self):
+        request = self.make_request({"asset_url": "http://a.br/a.jpg"}, "text/plain")
+        with patch.object(restfulapi, "colander_body_validator") as mock_colander:
+            restfulapi.fast_body_validator(restfulapi._validate_asset)(
+                request, schema=restfulapi.AssetSchema()
+            )
+        mock_colander.assert_called_once_with(request, schema=mock.ANY)
+
+
+class OpenAPISpecUnitTests(unittest.TestCase):
+    def setUp(self):
+        restfulapi._openapi_spec_body.cache_clear()
+        self.addCleanup(restfulapi._openapi_spec_body.cache_clear)
+
+    def test_returns_the_spec_as_json(self):
+        response = restfulapi.openAPI_spec(testing.DummyRequest())
+        self.assertEqual(response.content_type, "application/json")
+        self.assertEqual(json.loads(response.body)["info"]["title"], "Kernel")
+
+    def test_spec_is_generated_once(self):
+        with patch.object(
+            restfulapi.CorniceSwagger,
+            "generate",
+            autospec=True,
+            return_value={"info": {"title": "Kernel"}},
+        ) as mock_generate:
+            restfulapi.openAPI_spec(testing.DummyRequest())
+            restfulapi.openAPI_spec(testing.DummyRequest())
+        mock_generate.assert_called_once()
+
+
+class ServicesRegistrationUnitTests(unittest.TestCase):
+    def test_all_services_are_registered(self):
+        self.assertEqual(set(restfulapi.SERVICES), set(get_services()))
+
+
+class MainUnitTests(unittest.TestCase):
+    def new_request(self, app):
+        request = Request.blank("/")
+        request.registry = app.registry
+        apply_request_extensions(
+            request, extensions=app.registry.getUtility(IRequestExtensions)
+        )
+        return request
+
+    def test_services_are_shared_between_requests(self):
+        app = restfulapi.main({}, **{"kernel.app.mongodb.dsn": "mongodb://db/"})
+        self.assertIs(self.new_request(app).services, self.new_request(app).services)
+
+
+class LRUCacheUnitTests(unittest.TestCase):
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = restfulapi._LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_clear(self):
+        cache = restfulapi._LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.clear()
+        self.assertIsNone(cache.get("a"))
+
+
+class XMLRendererUnitTests(unittest.TestCase):
+    def render(self, value, request):
+        renderer = restfulapi.XMLRenderer(None)
+        return renderer(value, {"request": request})
+
+    def test_bytes_are_returned_unchanged(self):
+        request = testing.DummyRequest()
+        self.assertEqual(self.render(b"<article/>", request), b"<article/>")
+        self.assertEqual(request.response.content_type, "text/xml")
+
+    def test_chunks_are_not_joined(self):
+        request = testing.DummyRequest()
+        chunks = [b"<article>", b"<p/>", b"</article>"]
+        self.assertIsNone(self.render(chunks, request))
+        self.assertIs(request.response.app_iter, chunks)
+        self.assertEqual(request.response.content_type, "text/xml")
+        self.assertEqual(request.response.content_length, 23)
+
+    def test_response_with_chunks_has_content_length(self):
+        chunks = [b"<article>", b"<p/>", b"</article>"]
+        with testing.testConfig() as config:
+            config.add_renderer("xml", restfulapi.XMLRenderer)
+            response = render_to_response(
+                "xml", chunks, request=testing.DummyRequest()
+            )
+        self.assertEqual(response.headers["Content-Length"], "23")
+        self.assertEqual(response.body, b"<article><p/></article>")
+
+
+@unittest.skipIf(restfulapi.orjson is None, "orjson is not installed")
+class OrjsonRendererUnitTests(unittest.TestCase):
+    def render(self, value, request):
+        renderer = restfulapi.OrjsonRenderer(None)
+        return renderer(value, {"request": request})
+
+    def test_renders_json_bytes(self):
+        value = {"id": "0034-8910-rsp-48-2", "versions": [("a", "b")], "n": 1}
+        body = self.render(value, testing.DummyRequest())
+        self.assertIsInstance(body, bytes)
+        self.assertEqual(
+            json.loads(body),
+            {"id": "0034-8910-rsp-48-2", "versions": [["a", "b"]], "n": 1},
+        )
+
+    def test_renders_integers_beyond_64_bits(self):
+        body = self.render({"n": 18446744073709551616}, testing.DummyRequest())
+        self.assertIsInstance(body, bytes)
+        self.assertEqual(json.loads(body), {"n": 18446744073709551616})
+
+    def test_sets_json_content_type(self):
+        request = testing.DummyRequest()
+        self.render({}, request)
+        self.assertEqual(request.response.content_type, "application/json")
+
+    def test_preserves_content_type_set_by_the_view(self):
+        request = testing.DummyRequest()
+        request.response.content_type = "application/vnd.api+json"
+        self.render({}, request)
+        self.assertEqual(request.response.content_type, "application/vnd.api+json")
+
+
 class ParseSettingsFunctionTests(unittest.TestCase):
     def test_known_values_are_preserved_when_given(self):
         defaults = [("apptest.foo", "APPTEST_FOO", str, "modified foo")]
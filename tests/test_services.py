@@ -1,11 +1,15 @@
+import os
 import unittest
 from unittest import mock
 import datetime
+from io import BytesIO
 
 from documentstore import services, exceptions, domain
 
 from . import apptesting
 
+_CWD = os.path.dirname(os.path.abspath(__file__))
+
 
 def make_services():
     session = apptesting.Session()
@@ -20,6 +24,160 @@ class CommandTestMixin:
         self.assertTrue(callable(self.command))
 
 
+def fetch_stream_stub(url, timeout=2):
+    return BytesIO(b"<article/>")
+
+
+@mock.patch("documentstore.domain.fetch_stream", new=fetch_stream_stub)
+class UpsertDocumentTest(CommandTestMixin, unittest.TestCase):
+    def setUp(self):
+        self.services, self.session = make_services()
+        self.command = self.services.get("upsert_document")
+
+    def versions(self, id):
+        return self.session.documents.fetch(id).manifest["versions"]
+
+    def test_events(self):
+        self.assertIn(services.Events.DOCUMENT_REGISTERED, self.SUBSCRIBERS_EVENTS)
+        self.assertIn(
+            services.Events.DOCUMENT_VERSION_REGISTERED, self.SUBSCRIBERS_EVENTS
+        )
+
+    def test_new_document_is_created(self):
+        self.assertEqual(
+            self.command(id="xpto", data_url="http://a.br/v1.xml"),
+            services.UpsertResult.CREATED,
+        )
+        self.assertEqual(len(self.versions("xpto")), 1)
+
+    def test_existing_document_gets_a_new_version(self):
+        self.command(id="xpto", data_url="http://a.br/v1.xml")
+        self.assertEqual(
+            self.command(id="xpto", data_url="http://a.br/v2.xml"),
+            services.UpsertResult.UPDATED,
+        )
+        versions = self.versions("xpto")
+        self.assertEqual(versions[-1]["data"], "http://a.br/v2.xml")
+
+    def test_same_version_is_unchanged(self):
+        self.command(id="xpto", data_url="http://a.br/v1.xml")
+        with mock.patch.object(self.session, "notify") as mock_notify:
+            self.assertEqual(
+                self.command(id="xpto", data_url="http://a.br/v1.xml"),
+                services.UpsertResult.UNCHANGED,
+            )
+        mock_notify.assert_not_called()
+        self.assertEqual(len(self.versions("xpto")), 1)
+
+    def test_command_notify_event(self):
+        with mock.patch.object(self.session, "notify") as mock_notify:
+            self.command(id="xpto", data_url="http://a.br/v1.xml")
+            self.command(id="xpto", data_url="http://a.br/v2.xml")
+        self.assertEqual(
+            mock_notify.call_args_list,
+            [
+                mock.call(
+                    services.Events.DOCUMENT_REGISTERED,
+                    {
+                        "document": mock.ANY,
+                        "id": "xpto",
+                        "data_url": "http://a.br/v1.xml",
+                        "assets": {},
+                    },
+                ),
+                mock.call(
+                    services.Events.DOCUMENT_VERSION_REGISTERED,
+                    {
+                        "document": mock.ANY,
+                        "id": "xpto",
+                        "data_url": "http://a.br/v2.xml",
+                        "assets": {},
+                    },
+                ),
+            ],
+        )
+
+    def test_concurrent_registration_becomes_a_new_version(self):
+        add = self.session.documents.add
+
+        def add_concurrently(document):
+            other = domain.Document(id="xpto")
+            other.new_version("http://a.br/v0.xml")
+            add(other)
+            add(document)
+
+        with mock.patch.object(
+            self.session.documents, "add", side_effect=add_concurrently
+        ):
+            self.assertEqual(
+                self.command(id="xpto", data_url="http://a.br/v1.xml"),
+                services.UpsertResult.UPDATED,
+            )
+        versions = self.versions("xpto")
+        self.assertEqual(
+            [v["data"] for v in versions], ["http://a.br/v0.xml", "http://a.br/v1.xml"]
+        )
+
+
+class DiffDocumentVersionsTest(CommandTestMixin, unittest.TestCase):
+    def setUp(self):
+        with open(os.path.join(_CWD, "0034-8910-rsp-48-2-0347.xml"), "rb") as f:
+            sample = f.read()
+        patcher = mock.patch(
+            "documentstore.domain.fetch_stream",
+            new=lambda url, timeout=2: BytesIO(sample),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        services._diff_versions.cache_clear()
+        self.addCleanup(services._diff_versions.cache_clear)
+
+        self.services, self.session = make_services()
+        self.command = self.services.get("diff_document_versions")
+        self.services["register_document"](
+            id="xpto", data_url="http://a.br/0034-8910-rsp-48-2-0347.xml"
+        )
+        # a primeira versão é registrada em uma data anterior às demais.
+        manifest = self.session.documents.fetch("xpto").manifest
+        manifest = {
+            **manifest,
+            "versions": [
+                {**manifest["versions"][0], "timestamp": "2018-01-01T00:00:00.000000Z"}
+            ],
+        }
+        self.session.documents.update(domain.Document(manifest=manifest))
+
+    def test_same_content_produces_empty_diff(self):
+        with mock.patch.object(services, "version_data_chunks") as mock_chunks:
+            diff = self.command(id="xpto", from_version_at="2100-01-01")
+        self.assertEqual(diff, b"")
+        mock_chunks.assert_not_called()
+
+    def test_diff_between_asset_versions(self):
+        self.services["register_asset_version"](
+            id="xpto",
+            asset_id="0034-8910-rsp-48-2-0347-gf01",
+            asset_url="http://a.br/gf01.jpg",
+        )
+        diff = self.command(id="xpto", from_version_at="2018-01-01")
+        self.assertIn(b"+++ latest", diff)
+        self.assertIn(b'+\t\t\t\t\t<graphic xlink:href="http://a.br/gf01.jpg"', diff)
+
+    def test_diffs_are_memoized(self):
+        self.services["register_asset_version"](
+            id="xpto",
+            asset_id="0034-8910-rsp-48-2-0347-gf01",
+            asset_url="http://a.br/gf01.jpg",
+        )
+        with mock.patch.object(
+            services, "version_data_chunks", wraps=domain.version_data_chunks
+        ) as mock_chunks:
+            first = self.command(id="xpto", from_version_at="2018-01-01")
+            second = self.command(id="xpto", from_version_at="2018-01-01")
+        self.assertEqual(first, second)
+        self.assertEqual(mock_chunks.call_count, 2)
+
+
 class CreateDocumentsBundleTest(CommandTestMixin, unittest.TestCase):
     def setUp(self):
         self.services, self.session = make_services()